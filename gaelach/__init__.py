@@ -10,11 +10,12 @@ from gaelach.core import pipe
 
 # acutis imports 
 from gaelach import acutis
-from gaelach.acutis.affiche import affiche
+from gaelach.acutis.affiche import affiche, affiche_pages
 from gaelach.acutis.count_na import count_na
 from gaelach.acutis.count_table import count_table
 from gaelach.acutis.pasteurize import pasteurize
 from gaelach.acutis.glimpse import glimpse
+from gaelach.acutis.profile import profile
 
 # verb imports
 from gaelach.verbs.select import select
@@ -22,21 +23,25 @@ from gaelach.verbs.mutate import mutate, across
 from gaelach.verbs.filter import filter
 from gaelach.verbs.group_by import group_by
 from gaelach.verbs.summarize import summarize
+from gaelach.verbs.bootstrap import bootstrap, Bootstrap
 from gaelach.verbs.reframe import reframe
 from gaelach.verbs.pull import pull
-from gaelach.verbs.join import join
+from gaelach.verbs.join import join, key_set, KeySet, join_index, JoinIndex
+from gaelach.verbs.partitioned_join import partitioned_join
 from gaelach.verbs.pivot import pivot_longer, pivot_wider
 from gaelach.verbs.unite import unite
 from gaelach.verbs.separate import separate
 from gaelach.verbs.bind_cols import bind_cols
 from gaelach.verbs.bind_rows import bind_rows
 from gaelach.verbs.arrange import arrange
-from gaelach.verbs.distinct import distinct 
+from gaelach.verbs.top_k import top_k
+from gaelach.verbs.distinct import distinct, distinct_chunks
 from gaelach.verbs.head import head
 from gaelach.verbs.tail import tail
 from gaelach.verbs.drop_na import drop_na
 from gaelach.verbs.slice import slice
-from gaelach.verbs.sample import sample
+from gaelach.verbs.slice_max import slice_max, slice_min
+from gaelach.verbs.sample import sample, sample_chunks
 from gaelach.verbs.rename import rename
 from gaelach.verbs.round import round
 from gaelach.verbs.relocate import relocate 
@@ -47,6 +52,9 @@ from gaelach.utils.helpers import starts_with, ends_with, contains, where, is_bo
 from gaelach.utils.if_else import if_else
 from gaelach.utils.case_when import case_when
 from gaelach.utils.row_contains import row_contains
+from gaelach.utils.bloom import bloom_filter, BloomFilter
+from gaelach.utils.alias import alias_table, AliasTable
+from gaelach.utils.sorting import desc
 from gaelach.utils.lambdas import to_lower, to_upper, to_strip, to_title, to_str, to_int, \
    to_float, to_date, to_na, to_zero, to_round, to_cat
     
@@ -56,11 +64,13 @@ __version__ = "0.2.2"
 # add to primary import 
 __all__ = ['_', 'Symbolic', 'select', 'mutate', 'filter', 'across', 'where', 'is_boolean', 
            'is_cat', 'is_float', 'is_integer', 'is_numeric', 'is_object', 'is_temporal', 
-           'all', 'starts_with', 'ends_with', 'contains', 'affiche', 'count_na', 'count_table',
-           'pasteurize', 'glimspe', 'group_by', 'summarize', 'reframe', 'pull', 'join', 
-           'pivot_longer', 'pivot_wider', 'unite', 'separate', 'bind_rows', 'bind_cols', 
-           'arrange', 'distinct', 'head', 'tail', 'drop_na', 'slice', 'sample', 'rename', 
-           'round', 'relocate', 'drop_na', 'if_else', 'case_when', 'row_contains', 'to_lower', 
-           'to_upper', 'to_strip', 'to_title', 'to_str', 'to_int', 'to_float', 'to_date', 
-           'to_na', 'to_zero', 'to_round', 'to_cat'
+           'all', 'starts_with', 'ends_with', 'contains', 'affiche', 'affiche_pages', 'count_na', 'count_table',
+           'pasteurize', 'glimspe', 'profile', 'group_by', 'summarize', 'bootstrap', 'Bootstrap', 'reframe', 'pull', 'join', 
+           'key_set', 'KeySet', 'join_index', 'JoinIndex', 'partitioned_join', 'pivot_longer', 
+           'pivot_wider', 'unite', 'separate', 'bind_rows', 'bind_cols', 
+           'arrange', 'top_k', 'desc', 'distinct', 'distinct_chunks', 'head', 'tail', 'drop_na', 'slice', 'slice_max', 
+           'slice_min', 'sample', 'sample_chunks', 'rename', 
+           'round', 'relocate', 'drop_na', 'if_else', 'case_when', 'row_contains', 'bloom_filter', 
+           'BloomFilter', 'alias_table', 'AliasTable', 'to_lower', 'to_upper', 'to_strip', 'to_title', 'to_str', 'to_int', 
+           'to_float', 'to_date', 'to_na', 'to_zero', 'to_round', 'to_cat'
         ]
\ No newline at end of file
@@ -4,10 +4,11 @@ Acutis module: Extended methods for Pandas objects.
 Importing this module adds additional methods to Pandas Series and DataFrame objects.
 """
 
-from gaelach.acutis.affiche import affiche             # Imports both the function and the method 
+from gaelach.acutis.affiche import affiche, affiche_pages             # Imports both the functions and the methods 
 from gaelach.acutis.count_na import count_na
 from gaelach.acutis.count_table import count_table
 from gaelach.acutis.pasteurize import pasteurize
 from gaelach.acutis.glimpse import glimpse 
+from gaelach.acutis.profile import profile
 
-__all__ = ['affiche', 'count_na', 'count_table', 'pasteurize', 'glimpse']
\ No newline at end of file
+__all__ = ['affiche', 'affiche_pages', 'count_na', 'count_table', 'pasteurize', 'glimpse', 'profile']
\ No newline at end of file
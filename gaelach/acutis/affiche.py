@@ -1,7 +1,8 @@
-# Define the affiche() method and function 
+# Define the affiche() method and function
 import pandas as pd
-import re
+import numpy as np
 import math
+import sys
 
 """
 affiche extension for Pandas DataFrames and Series.
@@ -13,435 +14,343 @@ Usage:
     df.affiche()
     df["col"].affiche()
 """
+
+# Border themes
+_BORDERS = {
+    "newspaper": {
+        "h": "═", "v": "║",
+        "tl": "╔", "tr": "╗",
+        "bl": "╚", "br": "╝",
+        "jn": "╬",
+        "l": "╠", "r": "╣",
+        "t": "╦", "b": "╩"
+    }
+}
+
+# Abbreviate common type names
+_TYPE_ABBREV = {
+    "string": "str",
+    "categorical": "cat",
+    "category": "cat",
+    "boolean": "bool",
+    "object": "obj",
+    "decimal": "dec",
+    "int32": "i32",
+    "int64": "i64",
+    "float32": "f32",
+    "float64": "f64",
+    "datetime64[ns]": "datetime",
+    "timedelta64[ns]": "timedelta"
+}
+
+_RESET = "\033[0m"
+_ELLIPSIS = "…"
+
+# Rows sampled (evenly spaced) to size the columns of a paged view
+_WIDTH_SAMPLE = 1000
+
 # Define the affiche() method
-def affiche(self, align="left", na_color="\033[91;3m", theme="newspaper"):
+def affiche(self, align="left", na_color="\033[91;3m", theme="newspaper",
+            max_rows=50, max_cols=None, max_width=None, file=None,
+            page_size=None, page=1):
     """
     Display a Pandas DataFrame or Series with formatted table borders and styling.
-    
+
     Args:
         self: the DataFrame instance
         align: text alignment ("left", "center", "right")
         na_color: ANSI color code for missing values
         theme: border theme ("newspaper")
-    
+        max_rows: show at most this many rows, split between the head and the
+                  tail around an ellipsis row (None shows every row)
+        max_cols: show at most this many columns, split the same way (None
+                  shows every column)
+        max_width: truncate cell text longer than this many characters
+        file: text stream to write to (default: sys.stdout)
+        page_size: show one page of this many rows instead of the head and
+                   tail (max_rows is then ignored)
+        page: which page to show, counting from 1 (negative counts from the end)
+
     Usage:
         df.affiche()
         df["col"].affiche()
+        big_df.affiche(max_rows=10, max_width=20)
+        big_df.affiche(page_size=100, page=20_000)
     """
-       
-    df = self
-
-    # Convert Series to DataFrame
-    if isinstance(df, pd.Series):
-        df = pd.DataFrame(df)
-    
-    # Handle empty DataFrame
-    if df.shape[1] == 0 or df.shape[0] == 0:
-        msg = "That table doesn't exist!"
-        width = len(msg)
-        top = f"╔{'═' * (width + 2)}╗"
-        mid = f"║ {msg} ║"
-        bot = f"╚{'═' * (width + 2)}╝"
-        print(f"{top}\n{mid}\n{bot}")
-        return None
-
-    # Border theme
-    if theme == "newspaper":
-        border = {
-            "h": "═", "v": "║",
-            "tl": "╔", "tr": "╗",
-            "bl": "╚", "br": "╝",
-            "jn": "╬",
-            "l": "╠", "r": "╣",
-            "t": "╦", "b": "╩"
-        }
-    else:
-        raise ValueError("Theme not supported. Try 'newspaper'")
+    _render(self, file, align, na_color, theme, max_rows, max_cols, max_width, page_size, page)
+    return None
 
-    reset = "\033[0m"
-
-    # Handle color for unique NA types
-    def color_na(x):
-        if pd.isna(x):
-            # Timestamp missing
-            if isinstance(x, pd.Timestamp):
-                return f"{na_color}NaT{reset}"
-            # Everything else (int, bool, str, object, categorical) → NA
-            return f"{na_color}NA{reset}"
-        return str(x)
-
-    # Width calculator (ignores ANSI codes)
-    def display_width(s):
-        clean = re.sub(r'\033\[[0-9;]*[mK]', '', str(s))
-        return len(clean)
-
-    # Extract index info
-    index_values = [str(idx) for idx in df.index]
-    index_name = "index"
-    index_dtype = str(df.index.dtype)
-
-    # Pull column types
-    col_types = [str(dtype) for dtype in df.dtypes]
-    
-    # Abbreviate common type names
-    type_abbrev = {
-        "string": "str",
-        "categorical": "cat",
-        "category": "cat",
-        "boolean": "bool",
-        "object": "obj",
-        "decimal": "dec",
-        "int32": "i32",
-        "int64": "i64",
-        "float32": "f32",
-        "float64": "f64",
-        "datetime64[ns]": "datetime",
-        "timedelta64[ns]": "timedelta"
-    }
+# Define the affiche_pages() method
+def affiche_pages(self, page_size=50, start=1, align="left", na_color="\033[91;3m",
+                  theme="newspaper", max_cols=None, max_width=None):
+    """
+    Iterate over a Pandas DataFrame or Series as rendered pages.
 
-    col_types = [type_abbrev.get(dtype.lower(), dtype) for dtype in col_types]
-    
-    # Abbreviate index dtype
-    index_dtype_abbrev = type_abbrev.get(str(df.index.dtype).lower(), str(df.index.dtype))
-    
-    # Prepend index to column names and types
-    col_names = [index_name] + list(df.columns)
-    col_types = [index_dtype_abbrev] + col_types
-    
-    # Column widths (starting with index)
-    col_widths = []
-    
-    # Index column width
-    header_width = display_width(index_name)
-    type_width = display_width(index_dtype_abbrev)
-    index_widths = [display_width(val) for val in index_values]
-    col_widths.append(max([header_width, type_width] + index_widths))
-    
-    # Regular column widths
-    for i, col in enumerate(df.columns):
-        header_width = display_width(col)
-        type_width = display_width(col_types[i + 1])
-        # Get column values and apply color_na
-        col_values = [color_na(val) for val in df[col].tolist()] 
-        data_widths = [display_width(val) for val in col_values]
-        col_widths.append(max([header_width, type_width] + data_widths))
-
-    # Draw horizontal line
-    def draw_hline(connector_left, connector_right, cross):
-        line = connector_left
-        for i, width in enumerate(col_widths):
-            line += border["h"] * (width + 2) + cross
-        line = line[:-1] + connector_right
-        return line
-
-    top_line = draw_hline(border["tl"], border["tr"], border["t"])
-    mid_line = draw_hline(border["l"], border["r"], border["jn"])
-    bot_line = draw_hline(border["bl"], border["br"], border["b"])
-
-    # Header
-    header_parts = [border["v"]]
-    for i, name in enumerate(col_names):
-        width = col_widths[i]
-        pad_total = width - display_width(name)
-    
-        if align == "left":
-            pad_left = 0
-        elif align == "center":
-            pad_left = math.floor(pad_total / 2)
-        elif align == "right":
-            pad_left = pad_total
-        else:
-            pad_left = 0
-
-        pad_right = pad_total - pad_left
-        header_parts.append(f" {' ' * pad_left}{name}{' ' * pad_right} {border['v']}")
-    header = "".join(header_parts)
-
-    # Type row
-    type_parts = [border["v"]]
-    for i, dtype in enumerate(col_types):
-        dtype_formatted = f"\033[3m{dtype.lower()}{reset}"
-        width = col_widths[i]
-        pad_total = width - display_width(dtype)
-
-        if align == "left":
-            pad_left = 0
-        elif align == "center":
-            pad_left = math.floor(pad_total / 2)
-        elif align == "right":
-            pad_left = pad_total
-        else:
-            pad_left = 0
-
-        pad_right = pad_total - pad_left
-        type_parts.append(f" {' ' * pad_left}{dtype_formatted}{' ' * pad_right} {border['v']}")
-    type_row = "".join(type_parts)
-
-    # Data rows
-    data_rows = []
-    for row_idx in range(len(df)):
-        row_parts = [border["v"]]
-        
-        # Index cell
-        index_content = index_values[row_idx]
-        width = col_widths[0]
-        pad_total = width - display_width(index_content)
-
-        if align == "left":
-            pad_left = 0
-        elif align == "center":
-            pad_left = math.floor(pad_total / 2)
-        elif align == "right":
-            pad_left = pad_total
-        else:
-            pad_left = 0
-
-        pad_right = pad_total - pad_left
-        row_parts.append(f" {' ' * pad_left}{index_content}{' ' * pad_right} {border['v']}")
-        
-        # Data cells
-        for col_idx, col_name in enumerate(df.columns):
-            content = color_na(df.iloc[row_idx][col_name])
-            width = col_widths[col_idx + 1]
-            pad_total = width - display_width(content)
-
-            if align == "left":
-                pad_left = 0
-            elif align == "center":
-                pad_left = math.floor(pad_total / 2)
-            elif align == "right":
-                pad_left = pad_total
-            else:
-                pad_left = 0
-
-            pad_right = pad_total - pad_left
-            row_parts.append(f" {' ' * pad_left}{content}{' ' * pad_right} {border['v']}")
-        data_rows.append("".join(row_parts))
-
-    # Print table
-    print(top_line)
-    print(header)
-    print(type_row)
-    print(mid_line)
-    print("\n".join(data_rows))
-    print(bot_line)
+    Args:
+        self: the DataFrame instance
+        page_size: rows per page
+        start: first page to yield, counting from 1 (negative counts from the end)
+        align, na_color, theme, max_cols, max_width: as in affiche()
 
-    return None
+    Usage:
+        pages = big_df.affiche_pages(page_size=40)
+        print(next(pages))
+    """
+    return _pages(self, page_size, start, align, na_color, theme, max_cols, max_width)
 
 # Monkey-patch Pandas DataFrame and LazyFrame
 pd.DataFrame.affiche = affiche
 pd.Series.affiche = affiche
+pd.DataFrame.affiche_pages = affiche_pages
+pd.Series.affiche_pages = affiche_pages
 
 # Define the affiche() function
-# Define the affiche() function
-def affiche(align="left", na_color="\033[91;3m", theme="newspaper"):
+def affiche(align="left", na_color="\033[91;3m", theme="newspaper",
+            max_rows=50, max_cols=None, max_width=None, file=None,
+            page_size=None, page=1):
     """
     Display a Pandas DataFrame or LazyFrame with formatted table borders and styling.
-    
+
     Args:
         align: text alignment ("left", "center", "right")
         na_color: ANSI color code for missing values
         theme: border theme ("newspaper")
-    
+        max_rows: show at most this many rows, split between the head and the
+                  tail around an ellipsis row (None shows every row)
+        max_cols: show at most this many columns, split the same way (None
+                  shows every column)
+        max_width: truncate cell text longer than this many characters
+        file: text stream to write to (default: sys.stdout)
+        page_size: show one page of this many rows instead of the head and
+                   tail (max_rows is then ignored)
+        page: which page to show, counting from 1 (negative counts from the end)
+
     Usage:
         df >> affiche()
+        df >> affiche(page_size=100, page=3)
     """
     def _affiche(df):
-   
-        # Handle empty DataFrame
-        if df.shape[1] == 0 or df.shape[0] == 0:
-            msg = "That table doesn't exist!"
-            width = len(msg)
-            top = f"╔{'═' * (width + 2)}╗"
-            mid = f"║ {msg} ║"
-            bot = f"╚{'═' * (width + 2)}╝"
-            print(f"{top}\n{mid}\n{bot}")
-            return None
-
-        # Border theme
-        if theme == "newspaper":
-            border = {
-                "h": "═", "v": "║",
-                "tl": "╔", "tr": "╗",
-                "bl": "╚", "br": "╝",
-                "jn": "╬",
-                "l": "╠", "r": "╣",
-                "t": "╦", "b": "╩"
-            }
-        else:
-            raise ValueError("Theme not supported. Try 'newspaper'")
-
-        reset = "\033[0m"
-
-        # Handle color for unique NA types
-        def color_na(x):
-            if pd.isna(x):
-                # Timestamp missing
-                if isinstance(x, pd.Timestamp):
-                    return f"{na_color}NaT{reset}"
-                # Everything else (int, bool, str, object, categorical) → NA
-                return f"{na_color}NA{reset}"
-            return str(x)
-
-        # Width calculator (ignores ANSI codes)
-        def display_width(s):
-            clean = re.sub(r'\033\[[0-9;]*[mK]', '', str(s))
-            return len(clean)
-
-        # Extract index info
-        index_values = [str(idx) for idx in df.index]
-        index_name = "index"
-        index_dtype = str(df.index.dtype)
-
-        # Pull column data types
-        col_types = [str(dtype) for dtype in df.dtypes]
-        
-        # Abbreviate common type names
-        type_abbrev = {
-            "string": "str",
-            "categorical": "cat",
-            "category": "cat",
-            "boolean": "bool",
-            "object": "obj",
-            "decimal": "dec",
-            "int32": "i32",
-            "int64": "i64",
-            "float32": "f32",
-            "float64": "f64",
-            "datetime64[ns]": "datetime",
-            "timedelta64[ns]": "timedelta"
-        }
-
-        col_types = [type_abbrev.get(str(dtype), str(dtype)) for dtype in df.dtypes]
-        
-        # Abbreviate index dtype
-        index_dtype_abbrev = type_abbrev.get(str(df.index.dtype), str(df.index.dtype))
-        
-        # Prepend index to column names and types
-        col_names = [index_name] + list(df.columns)
-        col_types = [index_dtype_abbrev] + col_types
-    
-        # Column widths (starting with index)
-        col_widths = []
-        
-        # Index column width
-        header_width = display_width(index_name)
-        type_width = display_width(index_dtype_abbrev)
-        index_widths = [display_width(val) for val in index_values]
-        col_widths.append(max([header_width, type_width] + index_widths))
-        
-        # Regular column widths
-        for i, col in enumerate(df.columns):
-            header_width = display_width(col)
-            type_width = display_width(col_types[i + 1])
-            # Get column values and apply color_na
-            col_values = [color_na(val) for val in df[col].tolist()]
-            data_widths = [display_width(val) for val in col_values]
-            col_widths.append(max([header_width, type_width] + data_widths))
-
-        # Draw horizontal line
-        def draw_hline(connector_left, connector_right, cross):
-            line = connector_left
-            for i, width in enumerate(col_widths):
-                line += border["h"] * (width + 2) + cross
-            line = line[:-1] + connector_right
-            return line
-
-        top_line = draw_hline(border["tl"], border["tr"], border["t"])
-        mid_line = draw_hline(border["l"], border["r"], border["jn"])
-        bot_line = draw_hline(border["bl"], border["br"], border["b"])
-
-        # Header
-        header_parts = [border["v"]]
-        for i, name in enumerate(col_names):
-            width = col_widths[i]
-            pad_total = width - display_width(name)
-
-            if align == "left":
-                pad_left = 0
-            elif align == "center":
-                pad_left = math.floor(pad_total / 2)
-            elif align == "right":
-                pad_left = pad_total
-            else:
-                pad_left = 0
-
-            pad_right = pad_total - pad_left
-            header_parts.append(f" {' ' * pad_left}{name}{' ' * pad_right} {border['v']}")
-        
-        header = "".join(header_parts)
-
-        # Type row
-        type_parts = [border["v"]]
-        for i, dtype in enumerate(col_types):
-            dtype_formatted = f"\033[3m{dtype.lower()}{reset}"
-            width = col_widths[i]
-            pad_total = width - display_width(dtype)
-
-            if align == "left":
-                pad_left = 0
-            elif align == "center":
-                pad_left = math.floor(pad_total / 2)
-            elif align == "right":
-                pad_left = pad_total
-            else:
-                pad_left = 0
-
-            pad_right = pad_total - pad_left
-            type_parts.append(f" {' ' * pad_left}{dtype_formatted}{' ' * pad_right} {border['v']}")
-        type_row = "".join(type_parts)
-
-        # Data rows
-        data_rows = []
-        for row_idx in range(len(df)):
-            row_parts = [border["v"]]
-            
-            # Index cell
-            index_content = index_values[row_idx]
-            width = col_widths[0]
-            pad_total = width - display_width(index_content)
-
-            if align == "left":
-                pad_left = 0
-            elif align == "center":
-                pad_left = math.floor(pad_total / 2)
-            elif align == "right":
-                pad_left = pad_total
-            else:
-                pad_left = 0
-
-            pad_right = pad_total - pad_left
-            row_parts.append(f" {' ' * pad_left}{index_content}{' ' * pad_right} {border['v']}")
-            
-            # Data cells
-            for col_idx, col_name in enumerate(df.columns):
-                content = color_na(df.iloc[row_idx][col_name])
-                width = col_widths[col_idx + 1]
-                pad_total = width - display_width(content)
-
-                if align == "left":
-                    pad_left = 0
-                elif align == "center":
-                    pad_left = math.floor(pad_total / 2)
-                elif align == "right":
-                    pad_left = pad_total
-                else:
-                    pad_left = 0
-
-                pad_right = pad_total - pad_left
-                row_parts.append(f" {' ' * pad_left}{content}{' ' * pad_right} {border['v']}")
-            
-            data_rows.append("".join(row_parts))
-
-        # Print table
-        print(top_line)
-        print(header)
-        print(type_row)
-        print(mid_line)
-        print("\n".join(data_rows))
-        print(bot_line)
-    
+        _render(df, file, align, na_color, theme, max_rows, max_cols, max_width, page_size, page)
+
     return _affiche
 
+# Define the affiche_pages() function
+def affiche_pages(page_size=50, start=1, align="left", na_color="\033[91;3m",
+                  theme="newspaper", max_cols=None, max_width=None):
+    """
+    Iterate over a Pandas DataFrame or Series as rendered pages.
+
+    Args:
+        page_size: rows per page
+        start: first page to yield, counting from 1 (negative counts from the end)
+        align, na_color, theme, max_cols, max_width: as in affiche()
+
+    Column widths are fixed up front from an evenly spaced sample of rows, so
+    every page lines up with the others; longer cells are cut to fit. Only
+    the rows of a page are formatted, when that page is requested.
+
+    Returns a function that turns a DataFrame into a generator of page strings.
+
+    Usage:
+        for page in df >> affiche_pages(page_size=40):
+            print(page)
+    """
+    def _affiche_pages(df):
+        return _pages(df, page_size, start, align, na_color, theme, max_cols, max_width)
+
+    return _affiche_pages
+
+def _render(df, file, align, na_color, theme, max_rows, max_cols, max_width, page_size=None, page=1):
+    """
+    Write a DataFrame or Series as a bordered table, one line at a time.
+
+    Only the rows and columns that will be shown are formatted: each column of
+    that window is converted to text once, widths come from the plain text,
+    and colour codes are added after padding.
+    """
+    out = sys.stdout if file is None else file
+    border = _border(theme)
+
+    # Convert Series to DataFrame
+    if isinstance(df, pd.Series):
+        df = pd.DataFrame(df)
+
+    # Handle empty DataFrame
+    if df.shape[1] == 0 or df.shape[0] == 0:
+        msg = "That table doesn't exist!"
+        width = len(msg)
+        out.write(f"╔{'═' * (width + 2)}╗\n║ {msg} ║\n╚{'═' * (width + 2)}╝\n")
+        return None
+
+    if page_size is not None:
+        pager = _pages(df, page_size, page, align, na_color, theme, max_cols, max_width)
+        out.write(next(pager))
+        return None
+
+    n_rows, n_cols = df.shape
+    rows, row_gap = _window(n_rows, max_rows)
+    cols, col_gap = _window(n_cols, max_cols)
+    columns = _columns(df.iloc[rows, cols], df, col_gap, max_width)
+    widths = [max(len(header), len(dtype), max((len(c) for c in cells), default=0))
+              for header, dtype, cells, _ in columns]
+
+    for text in _lines(columns, widths, row_gap, align, na_color, border):
+        out.write(text + "\n")
+    if row_gap is not None or col_gap is not None:
+        out.write(f"{n_rows:,} rows × {n_cols:,} columns\n")
+    return None
+
+def _pages(df, page_size, start, align, na_color, theme, max_cols, max_width):
+    """
+    Generate rendered pages of page_size rows, from page start to the last.
+
+    Widths are computed once, from at most _WIDTH_SAMPLE evenly spaced rows,
+    and each page only formats its own rows.
+    """
+    border = _border(theme)
+    if page_size is None or page_size < 1:
+        raise ValueError("page_size must be a positive number of rows")
+    if isinstance(df, pd.Series):
+        df = pd.DataFrame(df)
+
+    n_rows, n_cols = df.shape
+    n_pages = max(math.ceil(n_rows / page_size), 1)
+    page = start + n_pages + 1 if start < 0 else start
+    if not 1 <= page <= n_pages:
+        raise ValueError(f"page must be between 1 and {n_pages} (or -{n_pages} and -1)")
+
+    cols, col_gap = _window(n_cols, max_cols)
+    sample = np.unique(np.linspace(0, max(n_rows - 1, 0), min(n_rows, _WIDTH_SAMPLE)).astype(np.int64))
+    widths = [max(len(header), len(dtype), max((len(c) for c in cells), default=0))
+              for header, dtype, cells, _ in _columns(df.iloc[sample, cols], df, col_gap, max_width)]
+    return _page_texts(df, page, n_pages, page_size, cols, col_gap, widths, align, na_color, border, max_width)
+
+def _page_texts(df, page, n_pages, page_size, cols, col_gap, widths, align, na_color, border, max_width):
+    """Render pages page..n_pages with fixed widths (see _pages())."""
+    n_rows, n_cols = df.shape
+    for page in range(page, n_pages + 1):
+        first = (page - 1) * page_size
+        last = min(first + page_size, n_rows)
+        columns = _columns(df.iloc[first:last, cols], df, col_gap, max_width)
+
+        # Cut cells wider than the sampled width so every page lines up
+        columns = [(header, dtype, _truncate(cells, width), missing)
+                   for (header, dtype, cells, missing), width in zip(columns, widths)]
+
+        lines = list(_lines(columns, widths, None, align, na_color, border))
+        lines.append(f"Rows {first + 1:,}–{last:,} of {n_rows:,} × {n_cols:,} columns "
+                     f"(page {page:,} of {n_pages:,})")
+        yield "\n".join(lines) + "\n"
+
+def _border(theme):
+    """Look up a border theme."""
+    if theme not in _BORDERS:
+        raise ValueError("Theme not supported. Try 'newspaper'")
+    return _BORDERS[theme]
+
+def _columns(window, df, col_gap, max_width):
+    """
+    Format the index and every column of window as plain text.
+
+    Returns a list of (header, dtype, cells, missing) tuples, with an ellipsis
+    column where columns of df were cut.
+    """
+    columns = [("index", _abbreviate(df.index.dtype),
+                _truncate(np.array([str(v) for v in window.index], dtype=object), max_width),
+                np.zeros(len(window), dtype=bool))]
+    for pos in range(window.shape[1]):
+        series = window.iloc[:, pos]
+        columns.append((str(window.columns[pos]), _abbreviate(series.dtype),
+                        *_format_column(series, max_width)))
+    if col_gap is not None:
+        # Ellipsis column between the leading and trailing columns
+        gap = np.full(len(window), _ELLIPSIS, dtype=object)
+        columns.insert(col_gap + 1, (_ELLIPSIS, "", gap, np.zeros(len(window), dtype=bool)))
+    return columns
+
+def _lines(columns, widths, row_gap, align, na_color, border):
+    """Generate the lines of a bordered table from formatted columns."""
+    def hline(left, right, cross):
+        return left + cross.join(border["h"] * (w + 2) for w in widths) + right
+
+    def line(cells):
+        return border["v"] + "".join(f" {cell} {border['v']}" for cell in cells)
+
+    # Pad every column's cells, colouring missing values inside their padding
+    padded = []
+    for (_, _, cells, missing), width in zip(columns, widths):
+        padded.append([_pad(c, width, align, na_color if m else None)
+                       for c, m in zip(cells, missing)])
+
+    yield hline(border["tl"], border["tr"], border["t"])
+    yield line(_pad(header, w, align) for (header, _, _, _), w in zip(columns, widths))
+    yield line(_pad(dtype.lower(), w, align, "\033[3m")
+               for (_, dtype, _, _), w in zip(columns, widths))
+    yield hline(border["l"], border["r"], border["jn"])
+
+    for i in range(len(padded[0])):
+        if i == row_gap:
+            yield line(_pad(_ELLIPSIS, w, align) for w in widths)
+        yield line(texts[i] for texts in padded)
+
+    yield hline(border["bl"], border["br"], border["b"])
+
+def _window(n, limit):
+    """
+    Pick the positions to show out of n: everything, or the first ceil(limit / 2)
+    and the last floor(limit / 2).
+
+    Returns (positions, gap), where gap is the position within the shown ones
+    that the ellipsis goes before (None when nothing is cut).
+    """
+    if limit is None or n <= limit:
+        return np.arange(n), None
+    head = math.ceil(limit / 2)
+    return np.r_[0:head, n - (limit - head):n], head
+
+def _format_column(series, max_width):
+    """
+    Convert a column of the shown window to plain display text.
+
+    Each value goes through str() (the window is at most a page of rows), so
+    timestamps and timedeltas print in full; missing values print as NA.
+
+    Returns (cells, missing): an object array of strings and a boolean mask
+    of the missing cells.
+    """
+    missing = series.isna().to_numpy()
+    cells = np.array([str(v) for v in series], dtype=object)
+    cells[missing] = "NA"
+    return _truncate(cells, max_width), missing
+
+def _truncate(cells, max_width):
+    """Cut cells longer than max_width, ending them with an ellipsis."""
+    if max_width is not None:
+        long = np.fromiter((len(c) > max_width for c in cells), dtype=bool, count=len(cells))
+        for i in np.flatnonzero(long):
+            cells[i] = cells[i][:max(max_width - 1, 0)] + _ELLIPSIS
+    return cells
+
+def _abbreviate(dtype):
+    """Short display name for a dtype."""
+    name = str(dtype)
+    return _TYPE_ABBREV.get(name.lower(), name)
+
+def _pad(text, width, align, color=None):
+    """
+    Pad text to width according to align ("left", "center" or "right"),
+    optionally wrapping the text (not the padding) in an ANSI colour code.
+    """
+    pad_total = width - len(text)
+    if align == "center":
+        pad_left = math.floor(pad_total / 2)
+    elif align == "right":
+        pad_left = pad_total
+    else:
+        pad_left = 0
+    if color is not None and text:
+        text = f"{color}{text}{_RESET}"
+    return f"{' ' * pad_left}{text}{' ' * (pad_total - pad_left)}"
+
 # Export both for different use cases
-__all__ = ['affiche']  # The function version for piping
\ No newline at end of file
+__all__ = ['affiche', 'affiche_pages']  # The function versions for piping
@@ -1,3 +1,4 @@
+from gaelach.utils.sources import _is_path, _parquet_null_counts
 import pandas as pd
 import numpy as np
 
@@ -9,15 +10,25 @@ def count_na(self):
     This module monkey-patches the count_na() method onto pd.DataFrame.
     The patch is applied automatically when this module is imported.
 
-    Usage: df.count_na()
+    It also takes a Parquet file path or glob pattern, answered from the
+    null counts in the file footers without reading the data.
+
+    Usage: df.count_na() or count_na("data/*.parquet")
     """
-    # Count NAs for each column
-    na_counts = self.isna().sum().reset_index()
-    na_counts.columns = ["col", "na_count"]
+    if _is_path(self):
+        n_rows, counts = _parquet_null_counts(self)
+        na_counts = pd.DataFrame({"col": list(counts), "na_count": list(counts.values())},
+                                 columns=["col", "na_count"]).astype({"na_count": np.int64})
+    else:
+        n_rows = len(self)
+
+        # Count NAs for each column
+        na_counts = self.isna().sum().reset_index()
+        na_counts.columns = ["col", "na_count"]
 
     # Calculate percentages
     na_counts["na_percent"] = (
-        (na_counts["na_count"] / len(self) * 100)
+        (na_counts["na_count"] / n_rows * 100)
         .round(0)
         .astype(int)
         .astype(str) + "%"
@@ -28,7 +39,7 @@ def count_na(self):
         na_counts["na_count"] == 0,
         "0%",
         np.where(
-            (na_counts["na_count"] / len(self)) <= 0.0099,
+            (na_counts["na_count"] / n_rows) <= 0.0099,
             "<1%",
             na_counts["na_percent"]
         )
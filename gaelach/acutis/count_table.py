@@ -1,30 +1,124 @@
+from gaelach.utils.sketches import _RunningCounts
+from gaelach.utils.sources import _iter_chunks
 import pandas as pd
 import numpy as np
 
-def count_table(self):
+def count_table(self, top=None, approx=False, column=None, capacity=None, chunk_size=1_000_000):
     """
     count_table extension for Pandas Series.
 
     This module monkey-patches the count_table() method onto pd.Series.
     The patch is applied automatically when this module is imported.
 
-    Usage: series.count_table() or df["column"].count_table()
+    top: Only return the top most frequent values
+    approx: Count heavy hitters with a Misra-Gries summary of capacity values
+            instead of counting every value (needs top); counts are then lower
+            bounds, off by at most rows / (capacity + 1)
+    column: Column to count when the source is not a Series
+    capacity: Values kept by the approximate summary (default: 100 * top,
+              at least 1,000)
+    chunk_size: Rows counted per chunk in approximate and streaming modes
+
+    It also takes a DataFrame, a Parquet file path or glob pattern, or an
+    iterable of DataFrame chunks (with column=), counted chunk by chunk and
+    merged. Percentages are only formatted for the rows returned.
+
+    Usage: series.count_table() or df["column"].count_table(top=20)
+           or count_table("events/*.parquet", column="country", top=10)
     """
-    # Get value counts and convert to DataFrame
-    table = self.value_counts(dropna = False).reset_index()
-    table.columns = [self.name or "value", "count"]
-    
-    # Calculate percentages
-    table["percent"] = (table["count"] / table["count"].sum() * 100).round(0).astype(int).astype(str) + "%"
-    
-    # Handle the <1% case
-    table["percent"] = np.where(
-        (table["percent"] == "0%") & (table["count"] != 0),
-        "<1%",
-        table["percent"]
-    )
-    
+    if approx and top is None:
+        raise ValueError("approx=True needs top= (the number of heavy hitters to return)")
+
+    if isinstance(self, pd.Series):
+        name = self.name or "value"
+    elif column is None:
+        raise ValueError("count_table() needs column= when the source is not a Series")
+    else:
+        name = column
+
+    if isinstance(self, pd.Series) and not approx:
+        counts = _exact_counts(self, top)
+        total = len(self)
+    else:
+        capacity = capacity or max(100 * (top or 0), 1000)
+        counts, total = _chunked_counts(self, column, approx, capacity, chunk_size)
+
+    # Order by count (value_counts() has already done so when it hashed everything)
+    if top is not None:
+        counts = counts.nlargest(top, keep="first")
+    elif not counts.is_monotonic_decreasing:
+        counts = counts.sort_values(ascending=False, kind="stable")
+
+    table = pd.DataFrame({name: counts.index, "count": counts.array})
+    table["percent"] = _percent_labels(table["count"].to_numpy(dtype=np.int64), total)
     return table
 
+def _exact_counts(series, top):
+    """
+    Count every value of a Series (missing values included).
+
+    Categoricals count their codes, and NumPy integers or booleans spanning
+    a small range count their offsets from the minimum, both with
+    np.bincount; anything else goes through one hash pass (value_counts).
+    Values are listed in order of first appearance, so ties are ordered as
+    value_counts() orders them.
+    """
+    if isinstance(series.dtype, pd.CategoricalDtype):
+        codes = series.cat.codes.to_numpy()
+        counts = pd.Series(np.bincount(codes[codes >= 0], minlength=len(series.cat.categories)),
+                           index=series.cat.categories.astype(series.dtype))
+        n_missing = np.count_nonzero(codes < 0)
+        if n_missing:
+            counts = pd.concat([counts, pd.Series([n_missing], index=pd.CategoricalIndex([np.nan], dtype=series.dtype))])
+        return counts
+
+    # Plain NumPy integers and booleans only: nullable ones can hold <NA>
+    numpy_ints = isinstance(series.dtype, np.dtype) and series.dtype.kind in "biu"
+    values = series.to_numpy() if numpy_ints else None
+    if values is not None and len(values):
+        low, high = values.min(), values.max()
+        if int(high) - int(low) <= max(len(values), 1 << 16):
+            offsets = (values - low).astype(np.int64) if values.dtype.kind != "b" else values.astype(np.int64)
+            counts = np.bincount(offsets)
+
+            # List values by first appearance, as value_counts() breaks ties
+            first = np.full(len(counts), len(values), dtype=np.int64)
+            first[offsets[::-1]] = np.arange(len(values) - 1, -1, -1)
+            seen = np.flatnonzero(counts)
+            seen = seen[np.argsort(first[seen], kind="stable")]
+            index = (seen + low if values.dtype.kind != "b" else seen.astype(bool)).astype(values.dtype)
+            return pd.Series(counts[seen], index=index)
+
+    return series.value_counts(dropna=False, sort=top is None)
+
+def _chunked_counts(source, column, approx, capacity, chunk_size):
+    """
+    Count the values of one column chunk by chunk, merging the counts.
+
+    Returns (counts, total): exact counts or a Misra-Gries summary, and the
+    number of rows seen.
+    """
+    running = _RunningCounts(capacity if approx else None)
+    total = 0
+    if isinstance(source, pd.Series):
+        chunks = (source.iloc[start:start + chunk_size] for start in range(0, len(source), chunk_size))
+    else:
+        chunks = (chunk[column] for chunk in _iter_chunks(source, chunk_size, columns=[column]))
+
+    for chunk in chunks:
+        running.add(chunk.value_counts(dropna=False, sort=False))
+        total += len(chunk)
+
+    counts = running.result()
+    return (counts if counts is not None else pd.Series([], dtype=np.int64)), total
+
+def _percent_labels(counts, total):
+    """Format counts as whole percentages of total ("<1%" for small non-zero shares)."""
+    with np.errstate(invalid="ignore", divide="ignore"):
+        percent = np.round(counts / total * 100)
+    labels = np.char.add(np.nan_to_num(percent).astype(np.int64).astype(str), "%").astype(object)
+    labels[(labels == "0%") & (counts != 0)] = "<1%"
+    return labels
+
 # Monkey patch the method onto Series
-pd.Series.count_table = count_table
\ No newline at end of file
+pd.Series.count_table = count_table
@@ -1,3 +1,4 @@
+from gaelach.utils.sources import _is_path, _read_head, _count_rows
 import pandas as pd
 from io import StringIO
 from typing import Literal
@@ -28,6 +29,10 @@ def glimpse(
         - 'frame': returns glimpse data as DataFrame
         - 'self': prints output and returns original DataFrame
     
+    It also takes a Parquet file path or glob pattern: the row count comes
+    from the file footers and the values from the first rows of the first
+    row group, so the rest of the data is never decoded.
+
     Returns
     -------
     str, DataFrame, or None
@@ -43,8 +48,14 @@ def glimpse(
                 "expected one of 'string', 'frame', 'self', or None"
             )
     
+    # Read only what is shown from Parquet sources
+    if _is_path(self):
+        frame, n_rows = _read_head(self, max_items_per_column), _count_rows(self)
+    else:
+        frame, n_rows = self, len(self)
+
     # Limit number of values to display
-    max_n_values = min(max_items_per_column, len(self))
+    max_n_values = min(max_items_per_column, len(frame))
     
     def _column_to_row_output(col_name: str, dtype) -> tuple[str, str, list]:
         """Convert column info to row format for glimpse output."""
@@ -52,7 +63,7 @@ def glimpse(
         fn = repr if dtype == object else str
         
         # Get first n values
-        values = self[col_name].iloc[:max_n_values].tolist()
+        values = frame[col_name].iloc[:max_n_values].tolist()
         
         # Truncate column name if needed
         if len(col_name) > max_colname_length:
@@ -91,8 +102,8 @@ def glimpse(
     
     # Process all columns
     data = [
-        _column_to_row_output(col, self[col].dtype)
-        for col in self.columns
+        _column_to_row_output(col, frame[col].dtype)
+        for col in frame.columns
     ]
     
     # Return as DataFrame if requested
@@ -108,7 +119,7 @@ def glimpse(
     
     # Build output string
     output = StringIO()
-    output.write(f"Rows: {len(self)}\nColumns: {len(self.columns)}\n")
+    output.write(f"Rows: {n_rows}\nColumns: {len(frame.columns)}\n")
     
     for col_name, dtype_str, values in data:
         # Format values, replacing None with "NA" and truncating long values
@@ -0,0 +1,155 @@
+from gaelach.utils.keys import _hash_rows
+from gaelach.utils.sketches import _hll_registers, _hll_update, _hll_estimate, _RunningCounts
+from gaelach.utils.sources import _iter_chunks
+from concurrent.futures import ThreadPoolExecutor
+import pandas as pd
+import numpy as np
+import math
+
+# Values kept per column by the approximate (Misra-Gries) top-k summaries
+_TOP_CAPACITY = 1000
+
+class _ColumnProfile:
+    """
+    Running statistics of one column, updated chunk by chunk.
+
+    Every chunk is visited once: one hash pass (value_counts) for the distinct
+    count and the top values, plus NumPy reductions for the moments, which
+    are merged across chunks with Chan's parallel update.
+    """
+    def __init__(self, name, approx):
+        self.name = name
+        self.approx = approx
+        self.dtype = None
+        self.na_count = 0
+        self.memory = 0
+        self.min = self.max = None
+        self.orderable = True
+        self.numeric = None
+        self.n, self.mean, self.m2 = 0, 0.0, 0.0
+        self.counts = _RunningCounts(_TOP_CAPACITY if approx else None)
+        self.registers = _hll_registers() if approx else None
+
+    def update(self, series):
+        """Fold one chunk of the column into the statistics."""
+        if self.dtype is None:
+            self.dtype = series.dtype
+            self.numeric = pd.api.types.is_numeric_dtype(series) and not pd.api.types.is_bool_dtype(series)
+
+        missing = series.isna().to_numpy()
+        self.na_count += int(missing.sum())
+        self.memory += int(series.memory_usage(index=False, deep=True))
+        present = series[~missing] if missing.any() else series
+
+        counts = present.value_counts(sort=False)
+        counts = counts[counts.to_numpy() > 0]  # unused categories
+        self.counts.add(counts)
+        if self.approx:
+            _hll_update(self.registers, _hash_rows(present.to_frame()))
+
+        if len(present):
+            self._update_range(counts.index)
+        if self.numeric and len(present):
+            self._update_moments(present.to_numpy(dtype=np.float64))
+        return self
+
+    def _update_range(self, values):
+        """Merge the chunk's min and max (over its distinct values)."""
+        if not self.orderable:
+            return
+        try:
+            low, high = values.min(), values.max()
+            self.min = low if self.min is None or low < self.min else self.min
+            self.max = high if self.max is None or high > self.max else self.max
+        except TypeError:
+            # Unordered categoricals or mixed objects
+            self.orderable = False
+            self.min = self.max = None
+
+    def _update_moments(self, values):
+        """Merge the chunk's count, mean and sum of squared deviations."""
+        n = len(values)
+        mean = values.mean()
+        m2 = ((values - mean) ** 2).sum()
+        total = self.n + n
+        delta = mean - self.mean
+        self.m2 += m2 + delta * delta * self.n * n / total
+        self.mean += delta * n / total
+        self.n = total
+
+    def result(self, top_k):
+        """One row of the profile."""
+        counts = self.counts.result()
+        if self.approx:
+            distinct = _hll_estimate(self.registers)
+        else:
+            distinct = len(counts) if counts is not None else 0
+
+        top = [] if counts is None else counts.nlargest(top_k, keep="first").index.tolist()
+        return {
+            "column": self.name,
+            "dtype": str(self.dtype),
+            "na_count": self.na_count,
+            "distinct": distinct,
+            "min": self.min,
+            "max": self.max,
+            "mean": self.mean if self.numeric and self.n else np.nan,
+            "std": math.sqrt(self.m2 / (self.n - 1)) if self.numeric and self.n > 1 else np.nan,
+            "top": top,
+            "memory": self.memory,
+        }
+
+# Define a custom method profile() for summarizing every column at once
+def profile(self, top_k=5, distinct="exact", n_jobs=None, chunk_size=1_000_000):
+    """
+    profile extension for Pandas DataFrame.
+
+    This module monkey-patches the profile() method onto pd.DataFrame.
+    The patch is applied automatically when this module is imported.
+
+    Summarize every column in one pass: missing values, distinct values,
+    min/max, mean/std (numeric columns), the most frequent values and the
+    in-memory footprint in bytes.
+
+    top_k: Number of most frequent values to list per column
+    distinct: "exact" counts every distinct value; "approx" estimates the
+              distinct count with a HyperLogLog sketch (about 16 KB per
+              column, ~1% error) and the top values with a Misra-Gries
+              summary, so memory stays bounded on high-cardinality columns
+    n_jobs: Threads profiling columns in parallel (default: as many as the
+            executor picks; 1 disables threading)
+    chunk_size: Rows read per chunk from Parquet and approximate sources
+
+    It also takes a Parquet file path or glob pattern, or an iterable of
+    DataFrame chunks, which are profiled chunk by chunk without loading the
+    whole dataset.
+
+    Usage: df.profile() or profile("data/*.parquet", distinct="approx")
+    """
+    if distinct not in ("exact", "approx"):
+        raise ValueError("distinct must be 'exact' or 'approx'")
+    approx = distinct == "approx"
+
+    if isinstance(self, pd.DataFrame) and not approx:
+        # The whole frame is one chunk
+        chunks = [self]
+    else:
+        chunks = _iter_chunks(self, chunk_size)
+
+    profiles = None
+    with ThreadPoolExecutor(max_workers=n_jobs) as pool:
+        for chunk in chunks:
+            if profiles is None:
+                profiles = [_ColumnProfile(col, approx) for col in chunk.columns]
+            columns = [chunk.iloc[:, i] for i in range(chunk.shape[1])]
+            if n_jobs == 1:
+                list(map(_ColumnProfile.update, profiles, columns))
+            else:
+                list(pool.map(_ColumnProfile.update, profiles, columns))
+
+    return pd.DataFrame([p.result(top_k) for p in profiles or []],
+                        columns=["column", "dtype", "na_count", "distinct", "min", "max",
+                                 "mean", "std", "top", "memory"])
+
+# Monkey patch the method onto DataFrame
+pd.DataFrame.profile = profile
@@ -296,6 +296,14 @@ class ChainedSymbolicAttr:
         """
         return ColumnRange(self, other)
     
+    def __neg__(self):
+        """
+        Support negation, which arrange() reads as a descending sort.
+    
+        Usage: df >> arrange(-_.name.str.lower())
+        """
+        return ChainedSymbolicAttr(self, '__neg__', (), {})
+    
     # Patch in custom not_in() method
     def not_in(self, values):
         """
@@ -409,10 +417,33 @@ class ChainedSymbolicAttr:
                 # It's a property, just return it
                 return attr
 
+        # isin() also takes Bloom filters
+        if self.method_name == 'isin':
+            return _isin(col_data, *self.args, **self.kwargs)
+
         # Normal method call
         method = getattr(col_data, self.method_name)
         return method(*self.args, **self.kwargs)
     
+def _isin(col_data, values, bloom=None):
+    """
+    Membership test that also accepts Bloom filters.
+
+    values: List-like of values, or a Bloom filter (approximate membership)
+    bloom: Optional Bloom filter of values, used to skip the exact check for
+           rows it rules out
+
+    Returns a boolean Series aligned with col_data.
+    """
+    if hasattr(values, 'might_contain'):
+        return pd.Series(values.might_contain(col_data), index=col_data.index)
+    if bloom is None:
+        return col_data.isin(values)
+
+    mask = bloom.might_contain(col_data)
+    mask[mask] = col_data[mask].isin(values).to_numpy()
+    return pd.Series(mask, index=col_data.index)
+
 # Establish symbolic class for Pandas dataframes
 class Symbolic:
     """
@@ -0,0 +1,121 @@
+from gaelach.core.symbolic import SymbolicAttr
+import pandas as pd
+import numpy as np
+
+class AliasTable:
+    """
+    Walker alias table for repeated weighted draws with replacement.
+
+    Building the table costs a few linear passes over the weights; after that
+    every draw is one random slot plus one coin flip, however skewed the
+    weights are. Build it once and pass it to sample(weights=...) (or call
+    draw()) to reuse it across samples of the same rows.
+    """
+    def __init__(self, weights):
+        self.weights = _check_weights(np.asarray(weights, dtype=np.float64))
+        if len(self.weights) and not self.weights.sum() > 0:
+            raise ValueError("weights must not all be zero")
+        self.prob, self.alias = _build_alias(self.weights)
+
+    def draw(self, n, seed=None):
+        """
+        Draw n row positions with replacement, proportionally to the weights.
+
+        n: Number of draws
+        seed: Random seed or numpy Generator
+        """
+        rng = np.random.default_rng(seed)
+        slots = rng.integers(0, len(self.prob), n)
+        return np.where(rng.random(n) < self.prob[slots], slots, self.alias[slots])
+
+    def __len__(self):
+        return len(self.weights)
+
+    @property
+    def nbytes(self):
+        """Memory held by the table."""
+        return self.weights.nbytes + self.prob.nbytes + self.alias.nbytes
+
+def alias_table(source, weights=None):
+    """
+    Build an alias table for fast repeated weighted sampling with replacement.
+
+    source: A Series or array of weights, or a DataFrame
+    weights: Column name, symbolic column or symbolic expression holding the
+             weights (needed when source is a DataFrame)
+
+    Missing weights count as zero; negative or infinite weights raise a ValueError.
+
+    Usage:
+        table = alias_table(df, weights=_.population)
+        draws = [df >> sample(n=1000, weights=table, with_replacement=True, seed=i)
+                 for i in range(100)]
+    """
+    if isinstance(source, pd.DataFrame):
+        if weights is None:
+            raise ValueError("alias_table() needs weights= when the source is a DataFrame")
+        return AliasTable(_weight_values(source, weights))
+    return AliasTable(_weight_values(None, source))
+
+def _weight_values(df, weights):
+    """
+    Resolve sample weights into a float64 array with one entry per row.
+
+    weights: Column name, symbolic column or expression (evaluated on df), or
+             an array-like of weights
+    """
+    if isinstance(weights, str):
+        values = df[weights]
+    elif isinstance(weights, SymbolicAttr):
+        values = df[weights.name]
+    elif hasattr(weights, '_evaluate'):
+        values = weights._evaluate(df)
+    else:
+        values = weights
+
+    values = pd.Series(values).to_numpy(dtype=np.float64, na_value=np.nan)
+    if df is not None and len(values) != len(df):
+        raise ValueError(f"weights has {len(values)} entries but the DataFrame has {len(df)} rows")
+    return _check_weights(values)
+
+def _check_weights(weights):
+    """Zero out missing weights and reject negative or infinite ones."""
+    weights = np.where(np.isnan(weights), 0.0, weights)
+    if (weights < 0).any() or np.isinf(weights).any():
+        raise ValueError("weights must be non-negative and finite")
+    return weights
+
+def _build_alias(weights):
+    """
+    Build the (prob, alias) arrays of an alias table.
+
+    Slot i is kept with probability prob[i] and otherwise redirected to
+    alias[i]. Rather than pairing one under-full slot with one over-full slot
+    at a time, each round hands every under-full slot to the over-full slot
+    whose spare mass its deficit starts in (laid end to end), and over-full
+    slots that drop below one are handled in the next round.
+    """
+    n = len(weights)
+    scaled = weights * (n / weights.sum()) if n else weights.copy()
+    prob = np.ones(n)
+    alias = np.arange(n)
+
+    small = np.flatnonzero(scaled < 1)
+    large = np.flatnonzero(scaled >= 1)
+    while len(small) and len(large):
+        deficit = 1 - scaled[small]
+        bounds = np.cumsum(scaled[large] - 1)
+        owner = np.searchsorted(bounds, np.cumsum(deficit) - deficit, side="right")
+
+        # Deficits starting past the last bound are rounding error; those slots stay full
+        placed = owner < len(large)
+        small, owner, deficit = small[placed], owner[placed], deficit[placed]
+
+        prob[small] = scaled[small]
+        alias[small] = large[owner]
+        scaled[large] -= np.bincount(owner, weights=deficit, minlength=len(large))
+
+        small = large[scaled[large] < 1]
+        large = large[scaled[large] >= 1]
+
+    return prob, alias
@@ -0,0 +1,188 @@
+from gaelach.utils.keys import _KeyEncoder
+import pandas as pd
+import numpy as np
+
+def _group_codes(left_cols, right_cols, n_left, n_right):
+    """
+    Encode left and right "by" columns into shared dense group codes.
+
+    left_cols, right_cols: Lists of Series (empty puts every row in one group)
+    n_left, n_right: Row counts of each side
+
+    Returns (left_codes, right_codes, n_groups); left rows whose group never
+    occurs on the right get -1.
+    """
+    if not right_cols:
+        return np.zeros(n_left, dtype=np.int64), np.zeros(n_right, dtype=np.int64), 1
+
+    encoder = _KeyEncoder(right_cols)
+    right_codes, uniques = pd.factorize(encoder.keys)
+    key, found = encoder.encode(left_cols)
+    left_codes = np.where(found, pd.Index(uniques).get_indexer(key), -1)
+
+    return left_codes.astype(np.int64), right_codes.astype(np.int64), len(uniques)
+
+def _ranks(*series):
+    """
+    Rank values of several Series on one shared, order-preserving integer scale.
+
+    Returns (list of rank arrays, number of distinct values); nulls rank -1.
+    """
+    combined = pd.concat([pd.Series(s).reset_index(drop=True) for s in series], ignore_index=True)
+    codes, uniques = pd.factorize(combined, sort=True)
+
+    ranks = []
+    start = 0
+    for s in series:
+        ranks.append(codes[start:start + len(s)].astype(np.int64))
+        start += len(s)
+    return ranks, len(uniques)
+
+def _asof_positions(left_on, right_on, left_by, right_by, direction="backward",
+                    tolerance=None, allow_exact_matches=True):
+    """
+    Find the as-of match on the right for every left row.
+
+    Right rows are sorted once by (group, value) and every left row is located
+    with a single binary search over that composite order, so the cost is
+    O((n + m) log m) rather than a per-row scan.
+
+    left_on, right_on: Series of ordered values (times, numbers, ...)
+    left_by, right_by: Lists of Series that must match exactly (may be empty)
+    direction: "backward" (last right value <= left), "forward" (first right
+               value >= left) or "nearest"
+    tolerance: Maximum allowed distance between the matched values
+    allow_exact_matches: Whether equal values count as matches
+
+    Returns an array of right row positions, -1 where a left row has no match.
+    """
+    if direction not in ("backward", "forward", "nearest"):
+        raise ValueError("direction must be one of 'backward', 'forward' or 'nearest'")
+
+    left_group, right_group, _ = _group_codes(left_by, right_by, len(left_on), len(right_on))
+    (left_rank, right_rank), n_values = _ranks(left_on, right_on)
+
+    # Sort the usable right rows by (group, value) and pack both into one key
+    usable = np.flatnonzero(right_rank >= 0)
+    right_key = right_group[usable] * n_values + right_rank[usable]
+    order = np.argsort(right_key, kind="stable")
+    right_pos = usable[order]
+    right_key = right_key[order]
+    right_group_sorted = right_group[right_pos]
+
+    valid_left = (left_group >= 0) & (left_rank >= 0)
+    left_key = left_group * n_values + left_rank
+    m = len(right_key)
+
+    def _backward():
+        side = "right" if allow_exact_matches else "left"
+        idx = np.searchsorted(right_key, left_key, side=side) - 1
+        ok = valid_left & (idx >= 0)
+        idx = np.clip(idx, 0, max(m - 1, 0))
+        if m:
+            ok &= right_group_sorted[idx] == left_group
+        return idx, ok
+
+    def _forward():
+        side = "left" if allow_exact_matches else "right"
+        idx = np.searchsorted(right_key, left_key, side=side)
+        ok = valid_left & (idx < m)
+        idx = np.clip(idx, 0, max(m - 1, 0))
+        if m:
+            ok &= right_group_sorted[idx] == left_group
+        return idx, ok
+
+    left_values = pd.Series(left_on).reset_index(drop=True)
+    right_values = pd.Series(right_on).reset_index(drop=True)
+
+    def _distance(idx, ok):
+        if not m:
+            return None
+        matched = right_values.iloc[right_pos[idx]].reset_index(drop=True)
+        return (left_values - matched).abs().where(ok)
+
+    if direction == "backward":
+        idx, ok = _backward()
+    elif direction == "forward":
+        idx, ok = _forward()
+    else:
+        back_idx, back_ok = _backward()
+        fwd_idx, fwd_ok = _forward()
+        back_dist = _distance(back_idx, back_ok)
+        fwd_dist = _distance(fwd_idx, fwd_ok)
+        # Ties go to the backward match, as merge_asof() does
+        use_fwd = fwd_ok & ~back_ok
+        if back_dist is not None:
+            use_fwd |= fwd_ok & back_ok & (fwd_dist < back_dist).to_numpy(dtype=bool, na_value=False)
+        idx = np.where(use_fwd, fwd_idx, back_idx)
+        ok = back_ok | fwd_ok
+
+    if tolerance is not None and m:
+        within = (_distance(idx, ok) <= tolerance).to_numpy(dtype=bool, na_value=False)
+        ok &= within
+
+    result = np.full(len(left_key), -1, dtype=np.int64)
+    if m:
+        result[ok] = right_pos[idx[ok]]
+    return result
+
+def _interval_positions(left_on, right_start, right_end, left_by, right_by, closed="left"):
+    """
+    Find every right interval that contains each left value.
+
+    Intervals are sorted by (group, start). For each left value, binary search
+    bounds the candidates to intervals starting no earlier than the value minus
+    the group's longest interval, and no later than the value itself; only
+    those candidates are checked against the interval end.
+
+    left_on: Series of values to place
+    right_start, right_end: Series of interval bounds
+    left_by, right_by: Lists of Series that must match exactly (may be empty)
+    closed: Which bounds are inclusive: "left" ([start, end)), "right",
+            "both" or "neither"
+
+    Returns (left_take, right_take) arrays of matching row positions.
+    """
+    if closed not in ("left", "right", "both", "neither"):
+        raise ValueError("closed must be one of 'left', 'right', 'both' or 'neither'")
+
+    left_group, right_group, n_groups = _group_codes(left_by, right_by, len(left_on), len(right_start))
+
+    left_values = pd.Series(left_on).reset_index(drop=True)
+    starts = pd.Series(right_start).reset_index(drop=True)
+    ends = pd.Series(right_end).reset_index(drop=True)
+
+    # Longest interval per group bounds how far back a containing interval can start
+    usable = (starts.notna() & ends.notna()).to_numpy()
+    durations = (ends - starts)[usable]
+    longest = durations.groupby(right_group[usable]).max().reindex(range(n_groups))
+
+    safe_group = np.where(left_group >= 0, left_group, 0)
+    lower = left_values - longest.iloc[safe_group].reset_index(drop=True)
+
+    (left_rank, lower_rank, start_rank), n_values = _ranks(left_values, lower, starts)
+
+    usable_pos = np.flatnonzero(usable & (start_rank >= 0))
+    right_key = right_group[usable_pos] * n_values + start_rank[usable_pos]
+    order = np.argsort(right_key, kind="stable")
+    right_pos = usable_pos[order]
+    right_key = right_key[order]
+
+    valid_left = (left_group >= 0) & (left_rank >= 0) & (lower_rank >= 0)
+    start_side = "right" if closed in ("left", "both") else "left"
+    hi = np.searchsorted(right_key, safe_group * n_values + left_rank, side=start_side)
+    lo = np.searchsorted(right_key, safe_group * n_values + lower_rank, side="left")
+    counts = np.where(valid_left, np.maximum(hi - lo, 0), 0)
+
+    # Expand each left row into its candidate intervals
+    left_take = np.repeat(np.arange(len(left_values)), counts)
+    offsets = np.arange(len(left_take)) - np.repeat(np.cumsum(counts) - counts, counts)
+    right_take = right_pos[np.repeat(lo, counts) + offsets] if len(left_take) \
+        else np.zeros(0, dtype=np.int64)
+
+    # Keep the candidates whose end lies past the value
+    point = left_values.iloc[left_take].to_numpy()
+    end = ends.iloc[right_take].to_numpy()
+    keep = end >= point if closed in ("right", "both") else end > point
+
+    return left_take[keep], right_take[keep]
@@ -0,0 +1,150 @@
+from gaelach.utils.keys import _hash_rows, _resolve_key_names
+from gaelach.utils.sources import _iter_chunks, _count_rows
+import pandas as pd
+import numpy as np
+import math
+
+class BloomFilter:
+    """
+    Compact probabilistic set of keys.
+
+    A membership test never misses a key that was added, but may report a key
+    that wasn't (at roughly error_rate). That makes it a cheap prefilter: rows
+    it rejects can be dropped before any exact membership check.
+
+    Filters with the same size and hash count can be merged with | (e.g. one
+    filter per shard), and saved to / loaded from a file.
+    """
+    def __init__(self, capacity, error_rate=0.01):
+        if capacity < 1:
+            capacity = 1
+        if not 0 < error_rate < 1:
+            raise ValueError("error_rate must be between 0 and 1")
+
+        n_bits = math.ceil(-capacity * math.log(error_rate) / math.log(2) ** 2)
+        self.n_bits = max(8, (n_bits + 7) // 8 * 8)
+        self.n_hashes = max(1, round(self.n_bits / capacity * math.log(2)))
+        self.bits = np.zeros(self.n_bits // 8, dtype=np.uint8)
+
+    def _positions(self, keys):
+        """Yield the bit positions of each key, one array per hash function."""
+        h1 = _hash_rows(_as_frame(keys))
+
+        # Derive a second, odd hash by mixing the first (double hashing)
+        with np.errstate(over="ignore"):
+            h2 = h1 + np.uint64(0x9E3779B97F4A7C15)
+            h2 = (h2 ^ (h2 >> np.uint64(30))) * np.uint64(0xBF58476D1CE4E5B9)
+            h2 = (h2 ^ (h2 >> np.uint64(27))) * np.uint64(0x94D049BB133111EB)
+            h2 = (h2 ^ (h2 >> np.uint64(31))) | np.uint64(1)
+
+            m = np.uint64(self.n_bits)
+            for i in range(self.n_hashes):
+                yield (h1 + np.uint64(i) * h2) % m
+
+    def add(self, keys):
+        """
+        Add keys to the filter.
+
+        keys: A Series, or a DataFrame of key columns (one key per row)
+        """
+        for pos in self._positions(keys):
+            np.bitwise_or.at(self.bits, pos >> np.uint64(3),
+                             np.left_shift(1, pos & np.uint64(7)).astype(np.uint8))
+        return self
+
+    def might_contain(self, keys):
+        """
+        Test keys against the filter.
+
+        keys: A Series, or a DataFrame of key columns (one key per row)
+
+        Returns a boolean numpy array: False means definitely absent, True
+        means probably present.
+        """
+        n = len(keys)
+        result = np.ones(n, dtype=bool)
+        candidates = np.arange(n)
+
+        for pos in self._positions(keys):
+            # Only keep testing the rows that are still candidates
+            pos = pos[candidates]
+            hit = (self.bits[pos >> np.uint64(3)] >> (pos & np.uint64(7)).astype(np.uint8)) & 1
+            result[candidates[hit == 0]] = False
+            candidates = candidates[hit == 1]
+            if not len(candidates):
+                break
+
+        return result
+
+    def __or__(self, other):
+        """Merge two filters built with the same parameters."""
+        if not isinstance(other, BloomFilter):
+            return NotImplemented
+        if (self.n_bits, self.n_hashes) != (other.n_bits, other.n_hashes):
+            raise ValueError("Only Bloom filters with the same size and hash count can be merged")
+        merged = BloomFilter.__new__(BloomFilter)
+        merged.n_bits = self.n_bits
+        merged.n_hashes = self.n_hashes
+        merged.bits = self.bits | other.bits
+        return merged
+
+    @property
+    def nbytes(self):
+        """Memory held by the filter's bit array."""
+        return self.bits.nbytes
+
+    def save(self, path):
+        """Write the filter to a file."""
+        with open(path, "wb") as f:
+            np.savez(f, bits=self.bits, params=np.array([self.n_bits, self.n_hashes]))
+
+    @classmethod
+    def load(cls, path):
+        """Read a filter written by save()."""
+        with np.load(path) as data:
+            bloom = cls.__new__(cls)
+            bloom.n_bits, bloom.n_hashes = (int(v) for v in data["params"])
+            bloom.bits = data["bits"]
+        return bloom
+
+def bloom_filter(source, on=None, capacity=None, error_rate=0.01, chunk_size=1_000_000):
+    """
+    Build a Bloom filter from a key column (or columns).
+
+    source: A Series, a DataFrame, a Parquet file path or glob pattern, or an
+            iterable of DataFrame chunks
+    on: Key column name(s) or symbolic column(s) (not needed for a Series)
+    capacity: Expected number of keys (default: the source's row count, which
+              must then be known)
+    error_rate: Target false positive rate
+    chunk_size: Rows read per chunk from file and iterable sources
+
+    Usage:
+        ids = bloom_filter("allow_list/*.parquet", on="id", error_rate=0.001)
+        df >> join(allow_df, on="id", how="semi", bloom=ids)
+        df >> filter(_.id.isin(ids))
+    """
+    if isinstance(source, pd.Series):
+        bloom = BloomFilter(capacity or len(source), error_rate)
+        return bloom.add(source)
+
+    cols = _resolve_key_names(on)
+    if cols is None:
+        raise ValueError("bloom_filter() needs on= unless the source is a Series")
+
+    if capacity is None:
+        capacity = _count_rows(source)
+        if capacity is None:
+            raise ValueError("capacity= is required when the source is an iterable of chunks")
+
+    bloom = BloomFilter(capacity, error_rate)
+    for chunk in _iter_chunks(source, chunk_size, columns=cols):
+        if len(chunk):
+            bloom.add(chunk)
+    return bloom
+
+def _as_frame(keys):
+    """Wrap a Series of keys in a one-column DataFrame."""
+    if isinstance(keys, pd.DataFrame):
+        return keys
+    return pd.Series(keys).to_frame()
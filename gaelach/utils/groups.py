@@ -0,0 +1,64 @@
+import pandas as pd
+import numpy as np
+
+def _ungroup(df_or_group):
+    """
+    Split a verb's input into its DataFrame and per-row group codes.
+
+    Returns a (df, codes, n_groups) tuple. codes is None for an ungrouped
+    DataFrame; otherwise it is an int64 array of group numbers (in the
+    GroupBy's group order), with -1 for rows that belong to no group
+    (missing keys, which groupby() drops).
+    """
+    if not isinstance(df_or_group, pd.core.groupby.GroupBy):
+        return df_or_group, None, 1
+
+    codes = df_or_group.ngroup().to_numpy(dtype=np.float64, na_value=-1).astype(np.int64)
+    return df_or_group.obj, codes, df_or_group.ngroups
+
+def _group_positions(codes, n_groups, order=None):
+    """
+    Rank rows within their group.
+
+    codes: Group number per row (-1 for rows in no group)
+    n_groups: Number of groups
+    order: Row order to rank in; must list the rows group by group
+           (default: original order within each group, from a stable sort)
+
+    Returns an (order, rank, sizes) tuple: the rows grouped together (rows in
+    no group dropped), each of those rows' position within its group, and each
+    of those rows' group size.
+    """
+    if order is None:
+        # NumPy's stable sort is a radix sort for 16-bit keys, so narrow
+        # codes sort in linear time
+        narrow = codes.astype(np.int16) if n_groups < np.iinfo(np.int16).max else codes
+        order = np.argsort(narrow, kind="stable")
+    # Rows in no group sort first
+    order = order[np.searchsorted(codes[order], 0):]
+
+    grouped = codes[order]
+    counts = np.bincount(grouped, minlength=n_groups)
+    starts = np.cumsum(counts) - counts
+    rank = np.arange(len(order)) - starts[grouped]
+    return order, rank, counts[grouped]
+
+def _slice_groups(codes, n_groups, start, stop):
+    """
+    Find the rows at positions start:stop of every group.
+
+    start, stop: Bounds as in a Python slice (None, or negative to count from
+                 the end of each group)
+
+    Returns row positions, group by group.
+    """
+    order, rank, sizes = _group_positions(codes, n_groups)
+    lo = _resolve_bound(start, sizes, 0)
+    hi = _resolve_bound(stop, sizes, sizes)
+    return order[(rank >= lo) & (rank < hi)]
+
+def _resolve_bound(bound, sizes, default):
+    """Turn a slice bound into per-row positions within each group."""
+    if bound is None:
+        return default
+    return np.clip(bound if bound >= 0 else sizes + bound, 0, sizes)
@@ -0,0 +1,179 @@
+from gaelach.core.symbolic import SymbolicAttr
+import pandas as pd
+import numpy as np
+import numbers
+
+def _resolve_key_names(cols):
+    """Convert key column spec(s) into a list of column names."""
+    if cols is None:
+        return None
+    if not isinstance(cols, (list, tuple)):
+        cols = [cols]
+    return [c.name if isinstance(c, SymbolicAttr) else c for c in cols]
+
+def _encode(series):
+    """
+    Dictionary-encode a Series into integer codes.
+
+    series: The Series to encode
+
+    Returns a (codes, uniques) tuple where codes is an int64 array (-1 for NA)
+    and uniques is a sorted Index of the distinct values.
+    """
+    # Categoricals are already dictionary-encoded
+    if isinstance(series.dtype, pd.CategoricalDtype):
+        return series.cat.codes.to_numpy(dtype=np.int64), series.cat.categories
+
+    codes, uniques = pd.factorize(series, sort=True)
+    return codes.astype(np.int64, copy=False), uniques
+
+# Hash shared by every missing key value
+_MISSING_HASH = np.uint64(0xFFFFFFFFFFFFFFFF)
+
+def _hash_rows(frame):
+    """
+    Hash each row of a frame of key columns to a uint64.
+
+    Values are hashed in a canonical form, so equal keys hash alike whatever
+    the column dtype on either side of a join: numbers (including those held
+    in object columns and nullable integers) are hashed as floats, so 1, 1.0
+    and an object 1 agree; strings hash alike as object, string or category;
+    and every missing value hashes to the same constant.
+    """
+    hashes = None
+    with np.errstate(over="ignore"):
+        for col in frame.columns:
+            column = _hash_column(frame[col])
+            hashes = column if hashes is None else (hashes * np.uint64(0x100000001B3)) ^ column
+    return hashes if hashes is not None else np.zeros(len(frame), dtype=np.uint64)
+
+def _hash_column(series):
+    """Hash one key column's values in their canonical form (see _hash_rows())."""
+    missing = series.isna().to_numpy()
+    if series.dtype == object:
+        kind = pd.api.types.infer_dtype(series, skipna=True)
+        if kind in ("integer", "floating", "mixed-integer-float", "decimal"):
+            series = series.astype("float64")
+        elif kind in ("mixed", "mixed-integer"):
+            # Hash the numbers among other values as floats, the rest as they are
+            numeric = np.fromiter((isinstance(v, numbers.Number) and not isinstance(v, (bool, np.bool_))
+                                   for v in series), dtype=bool, count=len(series)) & ~missing
+            hashes = pd.util.hash_pandas_object(series.where(~numeric, ""), index=False).to_numpy(copy=True)
+            hashes[numeric] = pd.util.hash_array(series[numeric].to_numpy(dtype=np.float64))
+            hashes[missing] = _MISSING_HASH
+            return hashes
+
+    if pd.api.types.is_numeric_dtype(series) and not pd.api.types.is_bool_dtype(series):
+        hashes = pd.util.hash_array(series.to_numpy(dtype=np.float64, na_value=np.nan))
+    else:
+        hashes = pd.util.hash_pandas_object(series, index=False).to_numpy(copy=True)
+    hashes[missing] = _MISSING_HASH
+    return hashes
+
+def _combine_codes(codes_list, sizes):
+    """
+    Pack several code arrays into one int64 composite key by mixed-radix packing.
+
+    codes_list: List of int64 code arrays (-1 for NA)
+    sizes: Number of distinct codes for each array
+
+    NA codes get their own slot, so rows only share a key when every code matches.
+    When the radix product would overflow int64 the running key is re-factorized.
+
+    Returns a (key, size) tuple where size bounds the composite key values.
+    """
+    limit = np.iinfo(np.int64).max
+    key = np.zeros(len(codes_list[0]) if codes_list else 0, dtype=np.int64)
+    size = 1
+
+    for codes, n in zip(codes_list, sizes):
+        radix = n + 1
+        if size > limit // radix:
+            # Compress the key built so far to keep the product in range
+            key, uniques = pd.factorize(key)
+            key = key.astype(np.int64, copy=False)
+            size = len(uniques)
+        key = key * radix + (codes + 1)
+        size = size * radix
+
+    return key, size
+
+class _KeyEncoder:
+    """
+    Encodes rows of one or more key columns into int64 keys over a fixed key space.
+
+    The key space is learned from the build-side columns, so any frame probed
+    against it gets keys that agree with the build side. Probe rows holding a
+    value the build side never saw are flagged as missing.
+    """
+    def __init__(self, columns):
+        limit = np.iinfo(np.int64).max
+        self.uniques = []
+        self.radices = []
+        self.compress = []
+
+        key = np.zeros(len(columns[0]) if columns else 0, dtype=np.int64)
+        size = 1
+
+        for col in columns:
+            # Keep NA as a regular value so it matches NA, as merge() does
+            codes, uniques = pd.factorize(col, use_na_sentinel=False)
+            radix = max(len(uniques), 1)
+
+            # Compress the key built so far if the radix product would overflow
+            if size > limit // radix:
+                partial = pd.Index(pd.unique(key))
+                key = partial.get_indexer(key).astype(np.int64, copy=False)
+                size = len(partial)
+                self.compress.append(partial)
+            else:
+                self.compress.append(None)
+
+            key = key * radix + codes
+            size = size * radix
+            self.radices.append(radix)
+            self.uniques.append(uniques if isinstance(uniques, pd.Index) else pd.Index(uniques))
+
+        self.keys = key
+        self.size = size
+
+    def encode(self, columns):
+        """
+        Encode probe-side columns into the build-side key space.
+
+        columns: List of Series, one per build-side key column
+
+        Returns a (key, found) tuple where found is False for rows whose values
+        don't occur on the build side (their key is meaningless).
+        """
+        n = len(columns[0]) if columns else 0
+        key = np.zeros(n, dtype=np.int64)
+        found = np.ones(n, dtype=bool)
+
+        for col, uniques, radix, partial in zip(columns, self.uniques, self.radices, self.compress):
+            if partial is not None:
+                key = partial.get_indexer(key).astype(np.int64, copy=False)
+                found &= key >= 0
+            codes = uniques.get_indexer(col)
+            found &= codes >= 0
+            key = key * radix + codes
+
+        return key, found
+
+    def __getstate__(self):
+        # Probing only needs the key space; the build side's per-row keys
+        # are used once by the caller and would dominate the pickle
+        state = self.__dict__.copy()
+        state.pop("keys", None)
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self.keys = None
+
+    @property
+    def nbytes(self):
+        """Approximate memory held by the key space."""
+        total = sum(u.memory_usage(deep=True) for u in self.uniques)
+        total += sum(p.memory_usage() for p in self.compress if p is not None)
+        return total
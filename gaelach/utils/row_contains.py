@@ -1,16 +1,38 @@
+from gaelach.core.symbolic import SymbolicAttr
+from gaelach.utils.strings import _substring_matcher, _match_values
 import pandas as pd
+import numpy as np
 
-def row_contains(*values):
+def row_contains(*values, columns=None):
     """
     Check if any rows in a DataFrame contain any of the specified values.
+
+    values: Substrings to search for (non-strings are converted with str())
+    columns: Column name(s) or symbolic column(s) to search (default: all columns)
+
+    All values are compiled once into a single matcher. Categorical and
+    low-cardinality columns are searched on their distinct values only, and the
+    per-column hits are OR-ed together; missing cells never match.
+
+    Usage:
+        df >> filter(row_contains("Â"))
+        df >> filter(row_contains(*keywords, columns=[_.title, _.body]))
     """
-    values_list = [str(v) for v in values]
-    
+    match = _substring_matcher([str(v) for v in values])
+
+    if columns is None:
+        names = None
+    else:
+        cols = columns if isinstance(columns, (list, tuple)) else [columns]
+        names = [c.name if isinstance(c, SymbolicAttr) else c for c in cols]
+
     def _row_contains(df):
-        # Check if any value is a substring of any column
-        return df.astype(str).apply(
-            lambda row: any(any(val in cell for val in values_list) for cell in row),
-            axis=1
-        )
-    
-    return _row_contains
\ No newline at end of file
+        # Check if any value is a substring of any searched column
+        positions = range(df.shape[1]) if names is None else [df.columns.get_loc(c) for c in names]
+
+        hits = np.zeros(len(df), dtype=bool)
+        for pos in positions:
+            hits |= _match_values(df.iloc[:, pos], match)
+        return pd.Series(hits, index=df.index)
+
+    return _row_contains
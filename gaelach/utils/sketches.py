@@ -0,0 +1,102 @@
+import pandas as pd
+import numpy as np
+
+# HyperLogLog registers are indexed by the top _HLL_PRECISION bits of a hash
+# (2**14 one-byte registers: about 16 KB, ~0.8% standard error)
+_HLL_PRECISION = 14
+
+def _hll_registers():
+    """Empty HyperLogLog registers."""
+    return np.zeros(1 << _HLL_PRECISION, dtype=np.uint8)
+
+def _hll_update(registers, hashes):
+    """
+    Add uint64 hashes to HyperLogLog registers (in place).
+
+    Each hash picks a register with its top bits and offers the position of
+    the first 1 bit in the rest; the register keeps the largest position seen.
+    Registers of different streams merge with np.maximum.
+    """
+    if len(hashes) == 0:
+        return registers
+    p = np.uint64(_HLL_PRECISION)
+    slots = (hashes >> (np.uint64(64) - p)).astype(np.intp)
+
+    # Leading zeros of the remaining bits, from the float exponent of their
+    # top 53 bits (exact in float64)
+    rest = ((hashes << p) >> np.uint64(11)).astype(np.float64)
+    _, exponent = np.frexp(rest)
+    ranks = np.where(rest > 0, 54 - exponent, 64 - _HLL_PRECISION + 1)
+    np.maximum.at(registers, slots, np.minimum(ranks, 64 - _HLL_PRECISION + 1).astype(np.uint8))
+    return registers
+
+def _hll_estimate(registers):
+    """Estimated number of distinct hashes added to HyperLogLog registers."""
+    m = len(registers)
+    alpha = 0.7213 / (1 + 1.079 / m)
+    estimate = alpha * m * m / np.ldexp(1.0, -registers.astype(np.int64)).sum()
+
+    # Small cardinalities: count the empty registers instead (linear counting)
+    zeros = np.count_nonzero(registers == 0)
+    if estimate <= 2.5 * m and zeros:
+        estimate = m * np.log(m / zeros)
+    return int(round(estimate))
+
+def _merge_counts(parts, capacity=None):
+    """
+    Add value -> count Series, optionally keeping a Misra-Gries summary.
+
+    parts: Series of counts indexed by value, merged in one hash pass (values
+           keep the order they first appear in)
+    capacity: Keep at most this many values. When there are more, the
+              (capacity + 1)-th largest count is subtracted from every count
+              and values left at zero or below are dropped. Any value with
+              more than total / (capacity + 1) occurrences survives, and each
+              kept count undercounts by at most that much.
+    """
+    parts = [part for part in parts if part is not None]
+    if len(parts) == 1:
+        merged = parts[0]
+    else:
+        merged = pd.concat(parts).groupby(level=0, sort=False, dropna=False).sum()
+
+    if capacity is not None and len(merged) > capacity:
+        values = merged.to_numpy()
+        cut = np.partition(values, len(values) - capacity - 1)[len(values) - capacity - 1]
+        merged = merged[values > cut] - cut
+    return merged
+
+class _RunningCounts:
+    """
+    Value counts accumulated chunk by chunk.
+
+    Exact counts are merged once the pending chunk counts outgrow the merged
+    ones, so each value is re-hashed a logarithmic number of times; with a
+    capacity, a Misra-Gries summary of that many values is kept instead.
+    """
+    def __init__(self, capacity=None):
+        self.capacity = capacity
+        self.counts = None
+        self.pending, self.pending_size = [], 0
+
+    def add(self, counts):
+        """Add a value -> count Series."""
+        if self.capacity is not None:
+            self.counts = _merge_counts([self.counts, counts], self.capacity)
+            return self
+
+        self.pending.append(counts)
+        self.pending_size += len(counts)
+        if self.pending_size > max(len(self.counts) if self.counts is not None else 0, 1 << 16):
+            self._flush()
+        return self
+
+    def result(self):
+        """The merged counts (None if nothing was added)."""
+        self._flush()
+        return self.counts
+
+    def _flush(self):
+        if self.pending:
+            self.counts = _merge_counts([self.counts] + self.pending)
+            self.pending, self.pending_size = [], 0
@@ -0,0 +1,143 @@
+from gaelach.core.symbolic import SymbolicAttr, ChainedSymbolicAttr
+import pandas as pd
+import numpy as np
+
+class Descending:
+    """Marks a sort key (column or expression) as descending; see desc()."""
+    def __init__(self, key):
+        self.key = key
+
+def desc(key):
+    """
+    Sort by a column or expression in descending order.
+
+    key: Column name, symbolic column or symbolic expression
+
+    Usage:
+        df >> arrange(desc(_.name.str.lower()), _.id)
+    """
+    return Descending(key)
+
+def _sort_values(df, args, descending=False):
+    """
+    Evaluate arrange()-style sort arguments into key Series.
+
+    args: Column names, symbolic columns or symbolic expressions; -_.col,
+          -expression or desc(...) sort descending
+    descending: If True, reverses all sort orders
+
+    Returns a list of (Series, descending) tuples.
+    """
+    return [(values, desc != descending) for values, desc in (_sort_value(df, arg) for arg in args)]
+
+def _sort_value(df, arg, desc=False):
+    """Evaluate a single sort argument into a (Series, descending) tuple."""
+    if isinstance(arg, Descending):
+        return _sort_value(df, arg.key, not desc)
+
+    if isinstance(arg, SymbolicAttr):
+        try:
+            return df[object.__getattribute__(arg, '_original')], not desc
+        except AttributeError:
+            # Not negated
+            return df[object.__getattribute__(arg, '_column_name')], desc
+
+    if isinstance(arg, ChainedSymbolicAttr) and arg.method_name == '__neg__':
+        # -expression sorts the expression descending (so it works on strings too)
+        return _sort_value(df, arg.parent, not desc)
+
+    if hasattr(arg, '_evaluate'):
+        values = arg._evaluate(df)
+        if not isinstance(values, pd.Series):
+            values = pd.Series(values, index=df.index)
+        return values, desc
+
+    return df[arg], desc
+
+def _sort_key(series, descending=False, na_position="last"):
+    """
+    Encode a column as a numeric array whose ascending order is the requested
+    sort order, with missing values placed per na_position.
+
+    Floats and integers are used as they are (negated, or bit-flipped for
+    integers, when descending); everything else is factorized into sorted,
+    order-preserving integer codes.
+    """
+    if na_position not in ("last", "first"):
+        raise ValueError("na_position must be 'last' or 'first'")
+
+    dtype = series.dtype
+    if isinstance(dtype, np.dtype) and dtype.kind in "iub" and dtype != np.uint64:
+        key = series.to_numpy().astype(np.int64, copy=False)
+        return ~key if descending else key
+
+    if isinstance(dtype, np.dtype) and dtype.kind == "f":
+        key = series.to_numpy(dtype=np.float64)
+        missing = np.isnan(key)
+        # A real infinity would tie with the missing values, so encode those columns instead
+        if not (missing.any() and np.isinf(key).any()):
+            key = -key if descending else key.copy()
+            key[missing] = np.inf if na_position == "last" else -np.inf
+            return key
+
+    codes, uniques = pd.factorize(series, sort=True)
+    codes = codes.astype(np.int64, copy=False)
+    missing = codes < 0
+    if descending:
+        codes = len(uniques) - 1 - codes
+    codes[missing] = len(uniques) if na_position == "last" else -1
+    return codes
+
+def _sort_order(keys, stable=False):
+    """
+    Find the row order that sorts several keys (most significant first).
+
+    Adjacent keys are packed into as few int64 keys as their value ranges
+    allow, so most multi-key sorts become a single argsort; whatever doesn't
+    fit goes through one stable lexsort. Sorts on several keys are always
+    stable; stable only matters for a single key.
+    """
+    if len(keys) == 1:
+        return np.argsort(keys[0], kind="stable" if stable else "quicksort")
+
+    limit = np.iinfo(np.int64).max
+    packed = []
+    current, size = None, 1
+    for key in keys:
+        if key.dtype.kind == "f":
+            key = _dense_rank(key)
+        lo, hi = (int(key.min()), int(key.max())) if len(key) else (0, 0)
+        radix = hi - lo + 1
+
+        if current is not None and radix <= limit // size:
+            current = current * radix + (key - lo)
+            size *= radix
+            continue
+
+        if current is not None:
+            packed.append(current)
+        if radix > limit:
+            # Too wide to offset safely, so sort on it by itself
+            packed.append(key)
+            current, size = None, 1
+        else:
+            current, size = key - lo, radix
+    if current is not None:
+        packed.append(current)
+
+    if len(packed) == 1:
+        # Stable even when not asked for, as sort_values() is on several keys
+        return np.argsort(packed[0], kind="stable")
+    # lexsort is stable and takes the most significant key last
+    return np.lexsort(packed[::-1])
+
+def _dense_rank(key):
+    """Replace values by their dense rank (0 for the smallest), ties sharing a rank."""
+    order = np.argsort(key, kind="stable")
+    ordered = key[order]
+    starts = np.empty(len(key), dtype=bool)
+    starts[:1] = True
+    np.not_equal(ordered[1:], ordered[:-1], out=starts[1:])
+    ranks = np.empty(len(key), dtype=np.int64)
+    ranks[order] = np.cumsum(starts) - 1
+    return ranks
@@ -0,0 +1,138 @@
+import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+from concurrent.futures import ThreadPoolExecutor
+import glob
+import os
+
+def _is_path(source):
+    """Check if a source is a file path or glob pattern."""
+    return isinstance(source, (str, os.PathLike))
+
+def _expand_paths(source):
+    """Expand a path or glob pattern into a sorted list of file paths."""
+    return sorted(glob.glob(str(source))) or [source]
+
+def _iter_chunks(source, chunk_size, columns=None):
+    """
+    Yield DataFrame chunks from a DataFrame, Parquet path/glob or iterable.
+
+    columns: Optional list of columns to keep (only these are read from Parquet)
+    """
+    if isinstance(source, pd.DataFrame):
+        if columns is not None:
+            source = source[columns]
+        if len(source) == 0:
+            yield source
+        for start in range(0, len(source), chunk_size):
+            yield source.iloc[start:start + chunk_size]
+    elif _is_path(source):
+        for path in _expand_paths(source):
+            parquet = pq.ParquetFile(path)
+            yielded = False
+            for batch in parquet.iter_batches(batch_size=chunk_size, columns=columns):
+                yielded = True
+                yield batch.to_pandas()
+            if not yielded:
+                schema = parquet.schema_arrow
+                if columns is not None:
+                    schema = pa.schema([schema.field(c) for c in columns])
+                yield schema.empty_table().to_pandas()
+    else:
+        for chunk in source:
+            yield chunk if columns is None else chunk[columns]
+
+def _count_rows(source):
+    """Count the rows of a source without reading its data, or None if unknown."""
+    if isinstance(source, pd.DataFrame):
+        return len(source)
+    if _is_path(source):
+        return sum(pq.ParquetFile(path).metadata.num_rows for path in _expand_paths(source))
+    return None
+
+def _read_head(source, n):
+    """
+    Read the first n rows of a source, stopping as soon as they are in.
+
+    For Parquet files only the first batch of the first non-empty row group
+    is decoded.
+    """
+    head = None
+    for chunk in _iter_chunks(source, max(n, 1)):
+        if len(chunk):
+            return chunk.iloc[:n]
+        if head is None:
+            head = chunk
+    return head
+
+def _parquet_null_counts(source):
+    """
+    Count the rows of Parquet files and the missing values of each column
+    from the file footers, without decoding data pages.
+
+    Null counts come from each row group's column chunk statistics; a chunk
+    written without them (or a nested column) is read instead, for that row
+    group and column only. NaN stored as a floating point value rather than
+    as null is not counted.
+
+    Returns (n_rows, counts) with counts a dict of column name -> null count.
+    """
+    n_rows = 0
+    counts = {}
+    for path in _expand_paths(source):
+        parquet = pq.ParquetFile(path)
+        meta = parquet.metadata
+        schema = parquet.schema_arrow
+        index_columns = (schema.pandas_metadata or {}).get("index_columns", [])
+        names = [name for name in schema.names if name not in index_columns]
+        leaves = {meta.schema.column(i).path: i for i in range(meta.num_columns)}
+        n_rows += meta.num_rows
+
+        for name in names:
+            counts.setdefault(name, 0)
+        for group in range(meta.num_row_groups):
+            chunks = meta.row_group(group)
+            for name in names:
+                stats = chunks.column(leaves[name]).statistics if name in leaves else None
+                if stats is not None and stats.has_null_count:
+                    counts[name] += stats.null_count
+                else:
+                    counts[name] += parquet.read_row_group(group, columns=[name]).column(0).null_count
+    return n_rows, counts
+
+def _read_file(path):
+    """Read a whole Parquet or CSV file into a DataFrame, by its extension."""
+    name = str(path).lower()
+    if name.endswith((".csv", ".csv.gz", ".csv.bz2", ".csv.zip", ".csv.xz")):
+        return pd.read_csv(path)
+    return pd.read_parquet(path)
+
+def _read_frames(sources, n_jobs=None):
+    """
+    Gather the DataFrames of several sources, in order.
+
+    sources: DataFrames, Parquet/CSV file paths or glob patterns, or iterables
+             (including generators) of DataFrames
+    n_jobs: Threads used to read files (default: as many as the executor picks)
+
+    Files are read concurrently; the readers release the GIL while parsing.
+    """
+    # Lay out every frame's slot first, so files can be read out of order
+    frames = []
+    paths = {}
+    for source in sources:
+        if isinstance(source, pd.DataFrame):
+            frames.append(source)
+        elif _is_path(source):
+            for path in _expand_paths(source):
+                paths[len(frames)] = path
+                frames.append(None)
+        else:
+            frames.extend(source)
+
+    if paths:
+        with ThreadPoolExecutor(max_workers=n_jobs) as pool:
+            for slot, frame in zip(paths, pool.map(_read_file, paths.values())):
+                frames[slot] = frame
+
+    return frames
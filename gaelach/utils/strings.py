@@ -0,0 +1,246 @@
+import pandas as pd
+import numpy as np
+import pyarrow as pa
+import pyarrow.compute as pc
+import functools
+import re
+
+# Arrow-backed strings with pd.NA for missing values, used by the string kernels
+_STRING = pd.StringDtype("pyarrow")
+
+# pandas' default dtype for string results (str on pandas 3, object before)
+_DEFAULT_STRING = pd.Series(["a"]).dtype
+
+def _to_strings(series):
+    """
+    Convert a Series to Arrow-backed strings, keeping missing values missing.
+
+    Values are formatted as astype(str) would format them, so the result can
+    go straight to Arrow's vectorized string kernels.
+    """
+    dtype = series.dtype
+    if isinstance(dtype, pd.StringDtype) and dtype.storage == "pyarrow":
+        return series if dtype == _STRING else series.astype(_STRING)
+
+    if isinstance(dtype, pd.CategoricalDtype):
+        # Format each category once and take the strings through the codes
+        categories = _arrow(_to_strings(pd.Series(dtype.categories)))
+        codes = series.cat.codes.to_numpy()
+        strings = categories.take(pa.array(codes, mask=codes < 0))
+        return _from_arrow(strings, series)
+
+    if isinstance(dtype, np.dtype) and dtype.kind in "iu":
+        # Arrow formats integers exactly as str() does
+        return _from_arrow(pa.array(series.to_numpy()).cast(pa.large_string()), series)
+
+    return series.astype(object).astype(_STRING)
+
+def _from_strings(series):
+    """Convert Arrow-backed strings back to pandas' default string dtype."""
+    return series.astype(_DEFAULT_STRING)
+
+def _arrow(series):
+    """Get the Arrow large_string array behind a Series of strings."""
+    return pa.array(series.array).cast(pa.large_string())
+
+def _from_arrow(array, like):
+    """Wrap an Arrow string array in a Series with the index and name of like."""
+    return pd.Series(pd.arrays.ArrowStringArray(array),
+                     index=like.index, name=like.name)
+
+def _join_strings(columns, sep, na_rep=""):
+    """
+    Concatenate several Series element-wise with a separator.
+
+    columns: List of Series (any dtype; values are converted to strings)
+    sep: Separator placed between the values
+    na_rep: Replacement for missing values
+
+    Returns an Arrow-backed string Series aligned with the first column.
+    """
+    arrays = [_arrow(_to_strings(col)) for col in columns]
+    joined = pc.binary_join_element_wise(
+        *arrays, pa.scalar(sep, pa.large_string()),
+        null_handling="replace", null_replacement=na_rep
+    )
+    return _from_arrow(joined, columns[0])
+
+def _substring_matcher(needles):
+    """
+    Compile substrings into a single Arrow matching call.
+
+    Several needles are combined into one alternation, which Arrow's RE2
+    engine runs as an automaton over each string, so the cost doesn't grow
+    with a scan per needle.
+
+    Returns a function mapping an Arrow string array to a boolean numpy array
+    (missing values never match).
+    """
+    needles = list(dict.fromkeys(needles))
+    if not needles:
+        return lambda strings: np.zeros(len(strings), dtype=bool)
+
+    if len(needles) == 1:
+        kernel = "match_substring"
+        options = pc.MatchSubstringOptions(needles[0])
+    else:
+        kernel = "match_substring_regex"
+        options = pc.MatchSubstringOptions("|".join(_escape_re2(n) for n in needles))
+
+    def _match(strings):
+        hits = pc.call_function(kernel, [strings], options)
+        return hits.fill_null(False).to_numpy(zero_copy_only=False)
+
+    return _match
+
+def _match_values(series, match, sample_size=10_000, max_unique_ratio=0.5):
+    """
+    Apply a string matcher to a Series, matching each distinct value only once
+    where that pays off.
+
+    Categoricals are matched on their categories and non-string columns on
+    their factorized uniques (so they're formatted once per value); string
+    columns are factorized first when a sample shows few distinct values.
+    Hits are mapped back to rows through the codes.
+
+    Returns a boolean numpy array; missing values never match.
+    """
+    dtype = series.dtype
+    if isinstance(dtype, pd.CategoricalDtype):
+        codes = series.cat.codes.to_numpy()
+        uniques = pd.Series(dtype.categories)
+    elif _is_text(dtype) and (
+        len(series) <= sample_size
+        or series.iloc[:sample_size].nunique() > max_unique_ratio * sample_size
+    ):
+        return match(_arrow(_to_strings(series)))
+    else:
+        codes, uniques = pd.factorize(series)
+        uniques = pd.Series(uniques)
+
+    hits = match(_arrow(_to_strings(uniques)))
+    return np.append(hits, False)[codes]
+
+def _is_text(dtype):
+    """Check if a dtype holds strings (or arbitrary Python objects)."""
+    return isinstance(dtype, pd.StringDtype) or dtype == object
+
+def _escape_re2(text):
+    """Escape regex metacharacters so RE2 matches text literally."""
+    return re.sub(r"([\\.^$|?*+()\[\]{}])", r"\\\1", text)
+
+def _count_parts(series, sep, regex=False):
+    """
+    Count the parts each string splits into on a separator, without splitting.
+
+    Returns an int64 numpy array; missing values have 0 parts.
+    """
+    strings = _arrow(_to_strings(series))
+    count = pc.count_substring_regex if regex else pc.count_substring
+    parts = pc.add(count(strings, sep), 1).fill_null(0)
+    return parts.to_numpy(zero_copy_only=False).astype(np.int64)
+
+def _split_parts(series, sep, positions, regex=False, max_splits=None):
+    """
+    Split strings on a separator and pick out parts by position.
+
+    series: Series of values to split (converted to strings)
+    sep: Separator string, or a regex pattern if regex is True
+    positions: Part positions to return
+    max_splits: Stop splitting each string after this many splits
+
+    Returns a list of Arrow-backed string Series, one per position; rows
+    with too few parts are missing.
+    """
+    strings = _arrow(_to_strings(series))
+    split = pc.split_pattern_regex if regex else pc.split_pattern
+    lists = split(strings, pattern=sep, max_splits=max_splits)
+    
+    # Locate part i of each row through the list offsets
+    starts = lists.offsets.to_numpy()[:-1]
+    lengths = pc.list_value_length(lists).fill_null(0).to_numpy(zero_copy_only=False)
+    values = lists.values
+    
+    parts = []
+    for i in positions:
+        present = lengths > i
+        index = pa.array(np.where(present, starts + i, 0), mask=~present)
+        parts.append(_from_arrow(values.take(index), series))
+    return parts
+
+@functools.lru_cache(maxsize=256)
+def _compile_pattern(pattern):
+    """
+    Prepare an extraction pattern once per process.
+
+    The pattern is validated with re and its capturing groups are renamed
+    g0, g1, ... in order, since Arrow's extract_regex only reports named
+    groups.
+
+    Returns an (Arrow pattern, number of groups) tuple.
+    """
+    n_groups = re.compile(pattern).groups
+
+    out = []
+    i = 0
+    group = 0
+    in_class = False
+    while i < len(pattern):
+        char = pattern[i]
+        if char == "\\":
+            out.append(pattern[i:i + 2])
+            i += 2
+        elif in_class:
+            in_class = char != "]"
+            out.append(char)
+            i += 1
+        elif char == "[":
+            # A leading ] (after an optional ^) is a literal inside the class
+            end = i + 1 + (pattern[i + 1:i + 2] == "^")
+            end += pattern[end:end + 1] == "]"
+            out.append(pattern[i:end])
+            in_class = True
+            i = end
+        elif char == "(" and (pattern[i + 1:i + 2] != "?" or pattern.startswith("(?P<", i)):
+            # Capturing group, named or not
+            i = pattern.index(">", i) + 1 if pattern.startswith("(?P<", i) else i + 1
+            out.append(f"(?P<g{group}>")
+            group += 1
+        else:
+            out.append(char)
+            i += 1
+
+    return "".join(out), n_groups
+
+def _extract_parts(series, pattern):
+    """
+    Extract a regex's capture groups from each string in one Arrow pass.
+
+    Returns a list of Arrow-backed string Series, one per group; rows that
+    don't match are missing in every group.
+    """
+    arrow_pattern, n_groups = _compile_pattern(pattern)
+    if not n_groups:
+        raise ValueError("pattern needs at least one capture group")
+
+    strings = _arrow(_to_strings(series))
+    groups = pc.extract_regex(strings, pattern=arrow_pattern)
+    return [_from_arrow(pc.struct_field(groups, [i]), series) for i in range(n_groups)]
+
+def _convert_strings(series):
+    """
+    Parse Arrow-backed strings to integers, floats or datetimes, whichever
+    fits every value first, straight from the Arrow buffers.
+
+    Columns that don't parse (or hold no values) are returned as pandas'
+    default string dtype.
+    """
+    strings = _arrow(series)
+    if strings.null_count < len(strings):
+        for target in (pa.int64(), pa.float64(), pa.timestamp("ns")):
+            try:
+                parsed = pc.cast(strings, target)
+            except (pa.ArrowInvalid, pa.ArrowNotImplementedError):
+                continue
+            return pd.Series(parsed.to_pandas(), index=series.index, name=series.name)
+    return _from_strings(series)
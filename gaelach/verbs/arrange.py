@@ -1,45 +1,58 @@
-from gaelach.core.symbolic import SymbolicAttr, ChainedSymbolicAttr
+from gaelach.utils.sorting import _sort_values, _sort_key, _sort_order
+from gaelach.verbs.top_k import top_k
+
+class _Arrange:
+    """
+    The verb returned by arrange().
+
+    Behaves like any other verb when called on a DataFrame, and can also be
+    composed with a following head() or slice(): arrange(...) >> head(n)
+    becomes top_k(n, ...), which skips sorting the rows that are cut anyway.
+    """
+    def __init__(self, args, descending, na_position, stable):
+        self.args = args
+        self.descending = descending
+        self.na_position = na_position
+        self.stable = stable
+
+    def __call__(self, df):
+        keys = [_sort_key(values, desc, self.na_position)
+                for values, desc in _sort_values(df, self.args, self.descending)]
+        if not keys:
+            return df
+        return df.take(_sort_order(keys, stable=self.stable))
+
+    def __rshift__(self, other):
+        limit = getattr(other, '_limit', None)
+        if limit is None:
+            return NotImplemented
+
+        offset, n = limit
+        selected = top_k(offset + n, *self.args, descending=self.descending,
+                         na_position=self.na_position)
+        return lambda df: selected(df).iloc[offset:]
 
 # Define the arrange() verb
-def arrange(*args, descending=False):
+def arrange(*args, descending=False, na_position="last", stable=False):
     """
     Sort rows by column expressions.
-    
-    *args: Column names (strings) or symbolic columns
-           Use _.column_name for ascending
-           Use -_.column_name for descending
+
+    *args: Column names (strings), symbolic columns or symbolic expressions
+           Use _.column_name or _.name.str.lower() for ascending
+           Use -_.column_name, -_.name.str.lower() or desc(...) for descending
     descending: If True, reverses all sort orders (default: False)
-    
+    na_position: Where missing values sort: "last" (default) or "first"
+    stable: If True, rows with equal keys keep their original order (sorts on
+            several keys are always stable)
+
+    Each key is evaluated once and encoded as an order-preserving numeric array
+    (strings as sorted integer codes), the keys are packed together and sorted
+    in one pass (a lexsort when they don't fit one integer), and the rows are
+    reordered with a single take().
+
     Returns a function that performs the sort on a DataFrame.
+
+    Composed directly with head() or slice(), as in df >> (arrange(-_.x) >> head(10)),
+    only the kept rows are sorted (see top_k()).
     """
-    def _arrange(df):
-        cols = []
-        desc_flags = []
-        
-        for arg in args:
-            if isinstance(arg, SymbolicAttr):
-                try:
-                    is_negated = object.__getattribute__(arg, '_is_negated')
-                    original = object.__getattribute__(arg, '_original')
-                    cols.append(original)
-                    desc_flags.append(True)
-                except AttributeError:
-                    # Not negated
-                    col_name = object.__getattribute__(arg, '_column_name')
-                    cols.append(col_name)
-                    desc_flags.append(False)
-            elif isinstance(arg, ChainedSymbolicAttr):
-                cols.append(arg.name)
-                desc_flags.append(False)
-            else:
-                cols.append(arg)
-                desc_flags.append(False)
-        
-        if descending:
-            desc_flags = [not flag for flag in desc_flags]
-        
-        # pandas uses ascending parameter (opposite of descending)
-        ascending_flags = [not flag for flag in desc_flags]
-        return df.sort_values(by=cols, ascending=ascending_flags)
-    
-    return _arrange
\ No newline at end of file
+    return _Arrange(args, descending, na_position, stable)
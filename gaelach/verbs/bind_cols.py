@@ -15,8 +15,6 @@ def bind_cols(*dfs, suffix="_2"):
     Usage: df >> bind_cols(df2, df3)
     """
     def _bind_cols(df):
-        result = df.copy()
-        
         # Check row counts and warn if mismatched
         all_dfs = [df] + list(dfs)
         max_rows = max(d.shape[0] for d in all_dfs)
@@ -34,35 +32,50 @@ def bind_cols(*dfs, suffix="_2"):
                     f"but maximum is {max_rows}. Filling with NaNs."
                 )
         
-        for other_df in dfs:
-            # Reset index to align by position
-            other_reset = other_df.reset_index(drop=True)
-            
-            # Check for duplicate column names
-            result_cols = set(result.columns)
-            other_cols = set(other_reset.columns)
-            duplicate_cols = result_cols & other_cols
-            
-            if duplicate_cols:
-                # Rename duplicates in other_df
-                rename_map = {}
-                for col in duplicate_cols:
-                    base_name = col
-                    counter = 2
-                    new_name = f"{base_name}{suffix}"
-                    
-                    # Keep incrementing if still duplicate
-                    while new_name in result_cols or new_name in other_cols:
-                        counter += 1
-                        new_name = f"{base_name}_{counter}"
-                    
-                    rename_map[col] = new_name
+        if not dfs:
+            return df.copy()
+        
+        # Align every frame by position, under its final column names, then
+        # stack them all in a single concatenation
+        frames = []
+        for frame, names in zip(all_dfs, _resolve_names(all_dfs, suffix)):
+            frame = frame.set_axis(pd.RangeIndex(len(frame))).set_axis(names, axis=1)
+            if len(frame) < max_rows:
+                frame = frame.reindex(pd.RangeIndex(max_rows))
+            frames.append(frame)
+        
+        return pd.concat(frames, axis=1)
+    
+    return _bind_cols
+
+def _resolve_names(frames, suffix):
+    """
+    Work out every frame's output column names in one pass.
+
+    Columns of later frames that repeat an earlier name get the suffix, or
+    _3, _4, ... if that is taken too.
+
+    Returns a list of column name lists, one per frame.
+    """
+    seen = set(frames[0].columns)
+    resolved = [list(frames[0].columns)]
+    
+    for frame in frames[1:]:
+        own = set(frame.columns)
+        names = []
+        for col in frame.columns:
+            new_name = col
+            if col in seen:
+                counter = 2
+                new_name = f"{col}{suffix}"
                 
-                other_reset = other_reset.rename(columns=rename_map)
-            
-            # Stack horizontally using concat
-            result = pd.concat([result.reset_index(drop=True), other_reset], axis=1)
+                # Keep incrementing if still duplicate
+                while new_name in seen or new_name in own:
+                    counter += 1
+                    new_name = f"{col}_{counter}"
+            names.append(new_name)
         
-        return result
+        seen.update(names)
+        resolved.append(names)
     
-    return _bind_cols
\ No newline at end of file
+    return resolved
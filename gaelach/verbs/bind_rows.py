@@ -1,22 +1,113 @@
 from gaelach.core.symbolic import SymbolicAttr
+from gaelach.utils.sources import _read_frames
 import pandas as pd
+import numpy as np
 
-def bind_rows(*dfs):
+# Fill value for rows of frames that lack a column, by numpy dtype kind
+_MISSING = {"f": np.nan, "c": np.nan, "O": np.nan, "M": np.datetime64("NaT"), "m": np.timedelta64("NaT")}
+
+def bind_rows(*dfs, n_jobs=None):
     """
     Stack DataFrames vertically (row-wise).
-    
-    *dfs: Variable number of DataFrames to bind
-    
+
+    *dfs: Variable number of DataFrames to bind; each may also be a Parquet or CSV
+          file path or glob pattern, or an iterator/generator of DataFrames
+    n_jobs: Number of threads used to read files (default: chosen by the thread pool)
+
     Returns a function that takes a DataFrame and concatenates it with the others
     Uses union of all columns (fills missing with NaN)
-    
-    Usage: df >> bind_rows(df2, df3)
+
+    Column dtypes are unified up front: numeric columns promote to a common
+    numeric type, categoricals combine their categories, and anything else
+    follows pd.concat()'s rules. Each output column is allocated once and
+    filled frame by frame.
+
+    Usage:
+        df >> bind_rows(df2, df3)
+        df >> bind_rows("partitions/day=*/*.parquet", n_jobs=8)
+        df >> bind_rows(chunk for chunk in pd.read_csv("big.csv", chunksize=100_000))
     """
     def _bind_rows(df):
         # Combine the piped df with the additional dfs
-        all_dfs = [df] + list(dfs)
-        
-        # Concatenate with union of columns, ignore index
-        return pd.concat(all_dfs, axis=0, ignore_index=True, sort=False)
-    
-    return _bind_rows
\ No newline at end of file
+        all_dfs = _read_frames([df, *dfs], n_jobs=n_jobs)
+
+        # Union of columns, in order of first appearance
+        columns = list(dict.fromkeys(col for frame in all_dfs for col in frame.columns))
+        lengths = [len(frame) for frame in all_dfs]
+
+        result = {
+            col: _stack_column([frame[col] if col in frame.columns else None for frame in all_dfs],
+                               lengths)
+            for col in columns
+        }
+        return pd.DataFrame(result, index=pd.RangeIndex(sum(lengths)), columns=columns, copy=False)
+
+    return _bind_rows
+
+def _common_dtype(dtypes, has_missing):
+    """
+    Pick the dtype a column gets when its pieces are stacked.
+
+    dtypes: The dtypes of the pieces that have the column
+    has_missing: Whether some pieces lack the column (their rows become missing)
+    """
+    dtypes = list(dict.fromkeys(dtypes))
+
+    if all(isinstance(d, pd.CategoricalDtype) for d in dtypes):
+        # Union the categories (in order of appearance) rather than densifying
+        categories = dtypes[0].categories.append([d.categories for d in dtypes[1:]]).unique()
+        ordered = all(d.ordered and d == dtypes[0] for d in dtypes)
+        return pd.CategoricalDtype(categories, ordered=ordered)
+
+    if all(isinstance(d, np.dtype) and d.kind in "iuf" for d in dtypes) \
+            or all(isinstance(d, np.dtype) and d.kind == "M" for d in dtypes):
+        dtype = np.result_type(*dtypes)
+    else:
+        # Same rules as pd.concat(), worked out on empty pieces
+        dtype = pd.concat([pd.Series([], dtype=d) for d in dtypes]).dtype
+
+    # Missing rows need a dtype that can hold them
+    if has_missing and isinstance(dtype, np.dtype):
+        if dtype.kind in "iu":
+            return np.dtype(np.float64)
+        if dtype.kind == "b":
+            return np.dtype(object)
+    return dtype
+
+def _stack_column(pieces, lengths):
+    """
+    Stack one column's pieces (None where a frame lacks the column) into a
+    single preallocated array.
+    """
+    present = [p for p in pieces if p is not None]
+    dtype = _common_dtype([p.dtype for p in present], len(present) < len(pieces))
+    total = sum(lengths)
+
+    if isinstance(dtype, pd.CategoricalDtype):
+        # Recode each piece's categories into the union and fill one code array
+        codes = np.full(total, -1, dtype=np.int32 if len(dtype.categories) > 32000 else np.int16)
+        start = 0
+        for piece, n in zip(pieces, lengths):
+            if piece is not None:
+                recode = dtype.categories.get_indexer(piece.cat.categories)
+                codes[start:start + n] = np.append(recode, -1)[piece.cat.codes.to_numpy()]
+            start += n
+        return pd.Categorical.from_codes(codes, dtype=dtype)
+
+    if isinstance(dtype, np.dtype):
+        out = np.empty(total, dtype=dtype)
+        if len(present) < len(pieces):
+            out[:] = _MISSING.get(dtype.kind)
+        start = 0
+        for piece, n in zip(pieces, lengths):
+            if piece is not None:
+                out[start:start + n] = piece.astype(dtype, copy=False).to_numpy()
+            start += n
+        return out
+
+    # Extension dtypes are stacked by their own concatenation
+    return pd.concat([
+        piece.astype(dtype, copy=False).reset_index(drop=True) if piece is not None
+        else pd.Series(index=range(n), dtype=dtype)
+        for piece, n in zip(pieces, lengths)
+    ], ignore_index=True).array
@@ -0,0 +1,275 @@
+from gaelach.core.symbolic import SymbolicAttr, ChainedSymbolicAttr
+from gaelach.core.pipe import _pipe_rshift
+from gaelach.utils.groups import _ungroup, _group_positions
+import pandas as pd
+import numpy as np
+import math
+
+# Aggregations that can be written as weighted sums over the rows
+_BOOTSTRAP_AGGS = ('count', 'sum', 'mean', 'var', 'std')
+
+# Rough number of weight-matrix cells (resamples x rows) held in memory at once
+_BLOCK_CELLS = 4_000_000
+
+def _poisson_tables():
+    """
+    Lookup tables for drawing Poisson(1) counts from uniform 32-bit integers.
+
+    A count is the number of CDF thresholds (scaled to 2**32) at or below the
+    draw. The table maps the draw's top 16 bits straight to the count, except
+    in the few buckets a threshold falls inside (marked -1), where the low 16
+    bits are needed to compare against the thresholds themselves.
+    """
+    cdf = np.cumsum([math.exp(-1) / math.factorial(k) for k in range(14)])
+    thresholds = np.minimum(np.floor(cdf * 2.0 ** 32), 2.0 ** 32 - 1).astype(np.uint32)
+    buckets = np.arange(65536, dtype=np.uint64) << 16
+    low = np.searchsorted(thresholds, buckets, side="right")
+    high = np.searchsorted(thresholds, buckets + 65535, side="right")
+    return thresholds, np.where(low == high, low, -1).astype(np.float64)
+
+_POISSON_THRESHOLDS, _POISSON_TABLE = _poisson_tables()
+
+class Bootstrap:
+    """
+    A DataFrame (or GroupBy) waiting to be bootstrapped by summarize().
+
+    Holds the rows laid out group by group, so every resample of every group
+    can be drawn as one matrix of row weights and each statistic reduced over
+    the whole matrix at once.
+    """
+    def __init__(self, df_or_group, n_resamples, seed, method):
+        df, codes, n_groups = _ungroup(df_or_group)
+        if codes is None:
+            codes = np.zeros(len(df), dtype=np.int64)
+            self.keys = None
+        else:
+            self.keys = df_or_group.size().index.to_frame(index=False)
+
+        self.df = df
+        self.order, _, _ = _group_positions(codes, n_groups)
+        self.counts = np.bincount(codes[self.order], minlength=n_groups)
+        self.starts = np.cumsum(self.counts) - self.counts
+        self.n_resamples = n_resamples
+        self.seed = seed
+        self.method = method
+
+    __rshift__ = _pipe_rshift
+
+    def summarize(self, **kwargs):
+        """
+        Compute each statistic on every resample.
+
+        **kwargs: Column names as keys, aggregation expressions as values
+                  (count, sum, mean, var or std, optionally after other methods
+                  such as _.x.astype(float).mean(), and before e.g. .round())
+
+        Returns a DataFrame with one row per resample (per group), numbered in
+        a "resample" column.
+        """
+        stats = {name: _parse_statistic(name, expr) for name, expr in kwargs.items()}
+
+        # Stack the row vectors every statistic needs, so each block of
+        # resamples is reduced for all of them in one pass over the weights
+        vectors = []
+        plans = {}
+        for name, stat in stats.items():
+            if stat is None:
+                continue
+            values, valid, centred = self._values(stat)
+            plans[name] = (stat[0], stat[1], len(vectors))
+            if stat[0] == 'count':
+                vectors += [valid]
+            elif stat[0] in ('sum', 'mean'):
+                vectors += [valid, values]
+            else:
+                vectors += [valid, centred, centred * centred]
+
+        n_groups, n_rows, n_resamples = len(self.counts), len(self.order), self.n_resamples
+        vectors = np.column_stack(vectors) if vectors else np.zeros((n_rows, 0))
+        method = self.method
+        if method == "auto":
+            method = "poisson" if n_rows >= 100_000 else "multinomial"
+
+        rng = np.random.default_rng(self.seed)
+        results = {name: np.empty((n_groups, n_resamples)) for name in plans}
+        block = max(1, _BLOCK_CELLS // max(n_rows, 1))
+
+        for start in range(0, n_resamples, block):
+            size = min(block, n_resamples - start)
+            sums = self._reduce(self._weights(size, method, rng), vectors)
+            for name, (agg, ddof, first) in plans.items():
+                results[name][:, start:start + size] = _weighted_stat(sums[..., first:], agg, ddof).T
+
+        result = {} if self.keys is None else {
+            col: np.repeat(self.keys[col].to_numpy(), n_resamples) for col in self.keys.columns
+        }
+        result["resample"] = np.tile(np.arange(n_resamples), n_groups)
+        for name, stat in stats.items():
+            if stat is None:
+                result[name] = kwargs[name]
+                continue
+            column = pd.Series(results[name].ravel())
+            for method_name, args, kw in stat[3]:
+                column = getattr(column, method_name)(*args, **kw)
+            result[name] = column.to_numpy()
+
+        frame = pd.DataFrame(result)
+        if self.keys is not None:
+            frame = frame.astype({col: self.keys[col].dtype for col in self.keys.columns})
+        return frame
+
+    def _values(self, stat):
+        """
+        Evaluate a statistic's column (and pre-aggregation methods) in grouped row order.
+
+        Returns (values, valid, centred): the values with missing ones zeroed,
+        1.0 where a value isn't missing, and the values minus their group mean
+        (zeroed where missing), which keeps sums of squares numerically stable.
+        """
+        _, _, pre_ops, _, column = stat
+        values = self.df[column]
+        for method_name, args, kw in pre_ops:
+            values = getattr(values, method_name)(*args, **kw)
+
+        values = pd.Series(values).to_numpy(dtype=np.float64, na_value=np.nan)[self.order]
+        valid = ~np.isnan(values)
+        values = np.where(valid, values, 0.0)
+        valid = valid.astype(np.float64)
+
+        group = np.repeat(np.arange(len(self.counts)), self.counts)
+        with np.errstate(invalid="ignore", divide="ignore"):
+            means = np.bincount(group, values, len(self.counts)) / np.bincount(group, valid, len(self.counts))
+        centred = (values - np.nan_to_num(means)[group]) * valid
+        return values, valid, centred
+
+    def _weights(self, size, method, rng):
+        """
+        Draw how many times each row appears in each of size resamples.
+
+        "multinomial" draws an index matrix (every group resampled to its own
+        size) and counts it; "poisson" gives every row an independent
+        Poisson(1) count, which avoids the index matrix for large inputs.
+        """
+        n_rows = len(self.order)
+        if method == "poisson":
+            # Table lookup is several times faster than rng.poisson(); only
+            # draws in a bucket straddling a threshold need their low 16 bits
+            draws = rng.integers(0, 65536, (size, n_rows), dtype=np.uint16)
+            weights = np.take(_POISSON_TABLE, draws)
+            unresolved = weights < 0
+            low = rng.integers(0, 65536, np.count_nonzero(unresolved), dtype=np.uint32)
+            full = (draws[unresolved].astype(np.uint32) << 16) | low
+            weights[unresolved] = np.searchsorted(_POISSON_THRESHOLDS, full, side="right")
+            return weights
+
+        group = np.repeat(np.arange(len(self.counts)), self.counts)
+        draws = self.starts[group] + (rng.random((size, n_rows)) * self.counts[group]).astype(np.int64)
+        draws += np.arange(size)[:, None] * n_rows
+        return np.bincount(draws.ravel(), minlength=size * n_rows).reshape(size, n_rows).astype(np.float64)
+
+    def _reduce(self, weights, vectors):
+        """
+        Sum weights * each row vector within each group.
+
+        weights: (resamples x rows) matrix of row counts
+        vectors: (rows x k) matrix of row vectors
+
+        Returns a (resamples x groups x k) array. Each group is a matrix
+        product over its slice of rows (one pass over the weights), unless
+        there are too many groups to loop over.
+        """
+        if len(self.counts) <= 256:
+            return np.stack([weights[:, start:start + count] @ vectors[start:start + count]
+                             for start, count in zip(self.starts, self.counts)], axis=1)
+        # reduceat() needs strictly increasing starts, so empty groups (unused
+        # categories) are skipped and keep sums of zero
+        nonempty = np.flatnonzero(self.counts)
+        sums = np.zeros((weights.shape[0], len(self.counts), vectors.shape[1]))
+        if len(nonempty):
+            for j, vector in enumerate(vectors.T):
+                sums[:, nonempty, j] = np.add.reduceat(weights * vector, self.starts[nonempty], axis=1)
+        return sums
+
+# Define the bootstrap() verb
+def bootstrap(n_resamples=1000, seed=None, method="auto"):
+    """
+    Resample rows with replacement for summarize() to compute statistics on.
+
+    n_resamples: Number of bootstrap resamples (default: 1000)
+    seed: Random seed (or numpy Generator) for reproducibility
+    method: How resamples are drawn
+            "multinomial" draws each resample's row indices (exact bootstrap)
+            "poisson" weights every row by an independent Poisson(1) count
+            "auto" (default) uses "poisson" from 100,000 rows up
+
+    Instead of running summarize() once per resample, every resample is
+    expressed as a matrix of row weights, and count, sum, mean, var and std are
+    computed as weighted sums over the whole matrix with NumPy, a block of
+    resamples at a time. Grouped input is resampled within each group.
+
+    Returns a function that prepares a DataFrame or GroupBy for summarize().
+
+    Usage:
+        df >> bootstrap(2000, seed=1) >> summarize(avg=_.revenue.mean())
+        df >> group_by(_.variant) >> bootstrap(seed=1) >> summarize(rate=_.converted.mean())
+    """
+    if method not in ("auto", "multinomial", "poisson"):
+        raise ValueError("method must be one of 'auto', 'multinomial' or 'poisson'")
+
+    def _bootstrap(df_or_group):
+        return Bootstrap(df_or_group, n_resamples, seed, method)
+
+    return _bootstrap
+
+def _parse_statistic(name, expr):
+    """
+    Split a summarize() expression into (agg, ddof, pre_ops, post_ops, column).
+
+    Returns None for literal values, which are repeated on every row.
+    """
+    if isinstance(expr, SymbolicAttr):
+        raise ValueError(f"'{name}' needs an aggregation, e.g. _.{expr.name}.mean()")
+    if not isinstance(expr, ChainedSymbolicAttr):
+        return None
+
+    operations = []
+    current = expr
+    while isinstance(current, ChainedSymbolicAttr):
+        operations.append((current.method_name, current.args, current.kwargs))
+        current = current.parent
+    operations.reverse()
+
+    agg_idx = next((i for i, (m, _, _) in enumerate(operations) if m in _BOOTSTRAP_AGGS), None)
+    if agg_idx is None:
+        raise ValueError(
+            f"'{name}': bootstrap summaries support {', '.join(_BOOTSTRAP_AGGS)} aggregations"
+        )
+
+    agg, args, kw = operations[agg_idx]
+    ddof = kw.get('ddof', args[0] if args else 1)
+    return agg, ddof, operations[:agg_idx], operations[agg_idx + 1:], expr.name
+
+def _weighted_stat(sums, agg, ddof):
+    """
+    Compute one statistic for a block of resamples.
+
+    sums: (resamples x groups x k) weighted sums of the statistic's row
+          vectors: the non-missing count, then the values (sum, mean) or the
+          centred values and their squares (var, std)
+
+    Returns a (resamples x groups) array.
+    """
+    count = sums[..., 0]
+    if agg == 'count':
+        return count
+
+    with np.errstate(invalid="ignore", divide="ignore"):
+        if agg == 'sum':
+            return sums[..., 1]
+        if agg == 'mean':
+            return sums[..., 1] / count
+
+        first, second = sums[..., 1], sums[..., 2]
+        var = (second - first * first / count) / (count - ddof)
+        var = np.where(count - ddof > 0, np.maximum(var, 0.0), np.nan)
+    return np.sqrt(var) if agg == 'std' else var
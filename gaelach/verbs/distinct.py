@@ -1,24 +1,166 @@
 from gaelach.core.symbolic import SymbolicAttr
+from gaelach.verbs.mutate import _evaluate_expression
+from gaelach.utils.keys import _combine_codes
+from gaelach.utils.sources import _iter_chunks
+import pandas as pd
+import numpy as np
+import os
 
-def distinct(*args):
+def distinct(*args, keep="first"):
     """
-    Keep only unique rows based on specified columns.
-    
-    *args: Column names (strings) or symbolic columns
-           If no columns specified, uses all columns
-    
+    Keep only unique rows based on specified columns or expressions.
+
+    *args: Column names (strings), symbolic columns or symbolic expressions
+           (e.g. _.email.str.lower()); if none are given, uses all columns
+    keep: Which row of each set of duplicates to keep
+          "first" (default) keeps the first occurrence
+          "last" keeps the last occurrence
+          "none" drops every key that occurs more than once
+
+    Each key column is factorized once and the codes are packed into a single
+    int64 key, so uniqueness is one hash pass over integers. All columns of the
+    kept rows are returned, in their original order.
+
     Returns a function that removes duplicate rows.
+
+    Usage:
+        df >> distinct(_.customer_id, _.day)
+        df >> distinct(_.email.str.lower(), keep="last")
     """
+    duplicated = _duplicated_policy(keep)
+
     def _distinct(df):
-        if not args:
-            return df.drop_duplicates()
+        key = _distinct_key(_key_columns(df, args))
+        dupes = pd.Series(key, copy=False).duplicated(keep=duplicated).to_numpy()
+        return df.take(np.flatnonzero(~dupes))
+
+    return _distinct
+
+def distinct_chunks(source, *args, chunk_size=1_000_000, sink=None):
+    """
+    Drop duplicate rows from a stream of chunks, keeping first occurrences.
+
+    source: A DataFrame, a Parquet file path or glob pattern, or an iterable
+            of DataFrame chunks
+    *args: Key columns or expressions, as in distinct() (default: all columns)
+    chunk_size: Rows read per chunk from DataFrame and Parquet sources
+    sink: Optional directory to write the result to as one Parquet file per
+          chunk; the function then returns the directory path
+
+    Keys seen so far are remembered as 64-bit row hashes in a few hash-indexed
+    levels (a few tens of bytes per distinct key), so memory grows with the
+    number of distinct keys rather than rows. Two distinct keys sharing a hash is
+    possible but vanishingly rare (around n**2 / 2**65 for n distinct keys).
+    Hashes depend on the dtype, so chunks should agree on their key dtypes.
+
+    Returns a generator of deduplicated DataFrame chunks, or the sink path if sink is set.
+
+    Usage:
+        for chunk in distinct_chunks("events/*.parquet", _.user_id, _.event_id):
+            ...
+        distinct_chunks(reader, "id", sink="dedup/")
+    """
+    chunks = _distinct_chunks(source, args, chunk_size)
+
+    if sink is None:
+        return chunks
+
+    os.makedirs(sink, exist_ok=True)
+    for i, chunk in enumerate(chunks):
+        chunk.to_parquet(os.path.join(sink, f"part-{i:05d}.parquet"), index=False)
+    return sink
+
+def _distinct_chunks(source, args, chunk_size):
+    """Yield each chunk's rows whose key wasn't seen in this or an earlier chunk."""
+    seen = _SeenKeys()
+
+    for chunk in _iter_chunks(source, chunk_size):
+        keys = pd.DataFrame({i: col.array for i, col in enumerate(_key_columns(chunk, args))})
+        hashes = pd.util.hash_pandas_object(keys, index=False).to_numpy()
+
+        # First occurrence within the chunk, and not seen in an earlier one
+        fresh = ~pd.Series(hashes, copy=False).duplicated().to_numpy()
+        fresh[fresh] = ~seen.contains(hashes[fresh])
+
+        seen.add(hashes[fresh])
+        if fresh.any():
+            yield chunk.take(np.flatnonzero(fresh))
+
+class _SeenKeys:
+    """
+    Growing set of uint64 keys.
+
+    Keys are kept in unique pd.Index levels whose sizes at least halve from
+    one level to the next, each looked up through its cached hash engine.
+    Adding a level merges it with every level not larger than itself, so
+    each key is re-indexed a logarithmic number of times and a lookup probes
+    a logarithmic number of levels.
+    """
+    def __init__(self):
+        self.levels = []
+
+    def contains(self, keys):
+        """Boolean mask of the keys already in the set."""
+        found = np.zeros(len(keys), dtype=bool)
+        for level in self.levels:
+            # Largest level first; later levels only see keys not found yet
+            missing = np.flatnonzero(~found)
+            if not len(missing):
+                break
+            found[missing] = level.get_indexer(keys[missing]) >= 0
+        return found
+
+    def add(self, keys):
+        """Add unique keys that aren't in the set yet."""
+        if not len(keys):
+            return
+        level = pd.Index(keys)
+        while self.levels and len(self.levels[-1]) <= len(level):
+            level = self.levels.pop().append(level)
+        self.levels.append(level)
+
+def _duplicated_policy(keep):
+    """Translate distinct()'s keep= into the keep= of duplicated()."""
+    policies = {"first": "first", "last": "last", "none": False}
+    if keep not in policies:
+        raise ValueError("keep must be one of 'first', 'last' or 'none'")
+    return policies[keep]
+
+def _key_columns(df, args):
+    """Resolve distinct() arguments into a list of key Series."""
+    if not args:
+        return [df.iloc[:, i] for i in range(df.shape[1])]
+
+    columns = []
+    for arg in args:
+        if isinstance(arg, str):
+            columns.append(df[arg])
+        elif isinstance(arg, SymbolicAttr):
+            columns.append(df[arg.name])
         else:
-            cols = []
-            for arg in args:
-                if isinstance(arg, SymbolicAttr):
-                    cols.append(arg.name)
-                else:
-                    cols.append(arg)
-            return df.drop_duplicates(subset=cols)
-    
-    return _distinct
\ No newline at end of file
+            values = _evaluate_expression(arg, df)
+            if not isinstance(values, pd.Series):
+                values = pd.Series(values, index=df.index)
+            columns.append(values)
+    return columns
+
+def _distinct_key(columns):
+    """
+    Pack key columns into one int64 key per row.
+
+    Codes are assigned in order of appearance (no sorting), and missing values
+    get a code of their own, so they count as equal to each other.
+    """
+    if not columns:
+        return np.zeros(0, dtype=np.int64)
+
+    codes_list = []
+    sizes = []
+    for col in columns:
+        codes, uniques = pd.factorize(col)
+        codes_list.append(codes.astype(np.int64, copy=False))
+        sizes.append(len(uniques))
+
+    if len(codes_list) == 1:
+        return codes_list[0]
+    return _combine_codes(codes_list, sizes)[0]
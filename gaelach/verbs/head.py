@@ -1,4 +1,5 @@
 from gaelach.core.symbolic import SymbolicAttr
+from gaelach.utils.groups import _ungroup, _slice_groups
 
 # Define the head() verb
 def head(n=5):
@@ -7,9 +8,20 @@ def head(n=5):
     
     n: Number of rows to return (default: 5)
     
+    On grouped input, returns the first n rows of each group, group by group.
+    
     Returns a function that selects the first n rows.
     """
-    def _head(df):
+    def _head(df_or_group):
+        df, codes, n_groups = _ungroup(df_or_group)
+        if codes is not None:
+            # As with DataFrame.head(), a negative n drops the last -n rows
+            start, stop = (0, n) if n >= 0 else (None, n)
+            return df.take(_slice_groups(codes, n_groups, start, stop))
         return df.head(n)
     
+    # Lets a preceding arrange() fuse with this into a top_k()
+    if n >= 0:
+        _head._limit = (0, n)
+    
     return _head
\ No newline at end of file
@@ -1,46 +1,330 @@
 from gaelach.core.symbolic import SymbolicAttr
+from gaelach.utils.keys import _KeyEncoder, _resolve_key_names
+from gaelach.utils.bloom import BloomFilter
+from gaelach.utils.asof import _asof_positions, _interval_positions
 import pandas as pd
+import numpy as np
+
+class KeySet:
+    """
+    Prebuilt set of key tuples for semi and anti joins.
+
+    Holds the distinct keys of the right-hand side, hashed once, so repeated
+    semi/anti joins against the same table don't rebuild it on every call.
+    """
+    def __init__(self, df, on):
+        self.on = _resolve_key_names(on)
+        self._encoder = _KeyEncoder([df[col] for col in self.on])
+        self._keys = pd.Index(pd.unique(self._encoder.keys))
+
+    def contains(self, df, on=None):
+        """
+        Test which rows of df have a key in the set.
+
+        df: DataFrame to probe
+        on: Key column name(s) in df (defaults to the key set's own names)
+
+        Returns a boolean numpy array, one entry per row of df.
+        """
+        cols = self.on if on is None else _resolve_key_names(on)
+        if len(cols) != len(self.on):
+            raise ValueError(
+                f"Key set was built on {len(self.on)} column(s) but {len(cols)} were given"
+            )
+
+        key, found = self._encoder.encode([df[col] for col in cols])
+
+        # A single key column is fully covered by its own uniques
+        if len(cols) == 1:
+            return found
+        return found & (self._keys.get_indexer(key) >= 0)
+
+    def __len__(self):
+        return len(self._keys)
+
+class JoinIndex(KeySet):
+    """
+    Prebuilt hash index over a (dimension) table for repeated joins.
+
+    Encodes the key columns once and keeps the table's row positions sorted by
+    key, so probing a new left-hand frame is a hash lookup plus a take() on the
+    table's columns instead of a full merge(). Supports "inner", "left",
+    "semi" and "anti" joins and can be pickled for reuse across workers.
+    """
+    def __init__(self, df, on):
+        self.on = _resolve_key_names(on)
+        self.df = df
+        self._encoder = _KeyEncoder([df[col] for col in self.on])
+
+        # Group row positions by key: rows of key i are _order[_starts[i]:_starts[i] + _counts[i]]
+        keys = self._encoder.keys
+        self._order = np.argsort(keys, kind="stable")
+        unique_keys, self._starts, self._counts = np.unique(
+            keys[self._order], return_index=True, return_counts=True
+        )
+        self._keys = pd.Index(unique_keys)
+
+    @property
+    def nbytes(self):
+        """Approximate memory held by the index, including the indexed table."""
+        total = int(self.df.memory_usage(deep=True).sum())
+        total += self._encoder.nbytes + self._keys.memory_usage()
+        total += self._order.nbytes + self._starts.nbytes + self._counts.nbytes
+        return total
+
+    def _probe(self, df, on, how):
+        """
+        Find the matching table rows for every row of df.
+
+        Returns (left_take, right_take) position arrays; right_take is -1 where
+        a left join keeps a row without a match.
+        """
+        cols = self.on if on is None else _resolve_key_names(on)
+        key, found = self._encoder.encode([df[col] for col in cols])
+
+        n = len(df)
+        if len(self._keys):
+            group = np.where(found, self._keys.get_indexer(key), -1)
+        else:
+            group = np.full(n, -1, dtype=np.int64)
+        matched = group >= 0
+        group = np.where(matched, group, 0)
+
+        counts = np.where(matched, self._counts[group] if len(self._keys) else 0, 0)
+        reps = np.maximum(counts, 1) if how == "left" else counts
+
+        left_take = np.repeat(np.arange(n), reps)
+
+        # Offset of each output row within its key's run of table rows
+        run_starts = np.cumsum(reps) - reps
+        offsets = np.arange(len(left_take)) - np.repeat(run_starts, reps)
+        starts = self._starts[group] if len(self._keys) else np.zeros(n, dtype=np.int64)
+        right_take = self._order[np.repeat(starts, reps) + offsets] if len(self._order) \
+            else np.zeros(len(left_take), dtype=np.int64)
+
+        if how == "left":
+            right_take = np.where(np.repeat(matched, reps), right_take, -1)
+
+        return left_take, right_take
+
+    def join(self, df, on=None, how="inner", suffixes=("_x", "_y")):
+        """
+        Join df (on the left) against the indexed table.
+
+        df: Left-hand DataFrame
+        on: Key column name(s) in df (defaults to the index's own key names)
+        how: "inner" or "left"
+        suffixes: Suffixes for overlapping non-key column names
+
+        Returns the joined DataFrame, matching df.merge(table, how=how).
+        """
+        left_cols = self.on if on is None else _resolve_key_names(on)
+        left_take, right_take = self._probe(df, left_cols, how)
+
+        # Key pairs sharing a name appear once, as merge() does
+        shared = {l for l, r in zip(left_cols, self.on) if l == r}
+        return _take_joined(df, left_take, self.df, right_take, shared, suffixes)
+
+def join_index(df, on):
+    """
+    Build a reusable join index over a table that is joined against repeatedly.
+
+    df: DataFrame to index (typically a static dimension table)
+    on: Column name(s) or symbolic column(s) forming the key
+
+    The index reports its memory footprint through .nbytes and can be pickled.
+
+    Usage:
+        dim = join_index(dim_df, on=[_.region, _.sku])
+        batch >> join(dim, on=["region", "sku"], how="left")
+    """
+    return JoinIndex(df, on)
+
+def key_set(df, on):
+    """
+    Build a reusable key set for semi and anti joins.
+
+    df: DataFrame whose key tuples make up the set
+    on: Column name(s) or symbolic column(s) forming the key
+
+    Usage:
+        allowed = key_set(allow_df, on=[_.region, _.sku])
+        df >> join(allowed, on=["region", "sku"], how="semi")
+    """
+    return KeySet(df, on)
+
+def _take_joined(left_df, left_take, right_df, right_take, shared, suffixes=("_x", "_y")):
+    """
+    Assemble a joined frame from matched row positions.
+
+    left_take, right_take: Row positions into each frame (-1 in right_take
+                           leaves the right columns missing for that row)
+    shared: Key column names kept once, from the left frame
+    suffixes: Suffixes for other overlapping column names
+    """
+    right_cols = [c for c in right_df.columns if c not in shared]
+    overlap = set(right_cols) & (set(left_df.columns) - shared)
+
+    left = left_df.take(left_take).reset_index(drop=True)
+    left.columns = [f"{c}{suffixes[0]}" if c in overlap else c for c in left_df.columns]
+
+    if (right_take < 0).any():
+        right = pd.DataFrame({
+            f"{c}{suffixes[1]}" if c in overlap else c:
+                pd.api.extensions.take(right_df[c].array, right_take, allow_fill=True)
+            for c in right_cols
+        })
+    else:
+        right = right_df[right_cols].take(right_take).reset_index(drop=True)
+        right.columns = [f"{c}{suffixes[1]}" if c in overlap else c for c in right_cols]
+
+    return pd.concat([left, right], axis=1)
+
+def _align_keys(keys, left_cols, right_cols):
+    """
+    Line up left key columns with the key columns of a key_set() or join_index().
+
+    right_cols: right_on column names, which must be the ones the set was
+                built on (in any order); None keeps left_cols as they are
+
+    Returns left_cols reordered to match the set's own key columns.
+    """
+    if right_cols is None:
+        return left_cols
+    if left_cols is None or len(left_cols) != len(right_cols) \
+            or len(set(right_cols)) != len(right_cols) or set(right_cols) != set(keys.on):
+        raise ValueError(
+            f"right_on must name the {len(keys.on)} key column(s) the key set was built on "
+            f"({keys.on}), each paired with a left_on column"
+        )
+    left_for = dict(zip(right_cols, left_cols))
+    return [left_for[c] for c in keys.on]
 
 # Define the join() verb
-def join(other, on=None, left_on=None, right_on=None, how="inner"):
+def join(other, on=None, left_on=None, right_on=None, how="inner", by=None,
+         direction="backward", tolerance=None, allow_exact_matches=True,
+         start=None, end=None, closed="left", bloom=None, suffixes=("_x", "_y")):
     """
     Join two DataFrames together.
-    
+
     Parameters:
     - other: DataFrame to join with
+             May also be a prebuilt join_index() for "inner", "left", "semi" and "anti"
+             joins, or a prebuilt key_set() for "semi" and "anti" joins, or a
+             bloom_filter() for approximate "semi" and "anti" joins
     - on: Column name(s) to join on (used when column names match)
     - left_on: Column name(s) from left DataFrame
-    - right_on: Column name(s) from right DataFrame  
+    - right_on: Column name(s) from right DataFrame
     - how: Join type:
-        "inner", "left", "right", "outer", "cross", "semi", "anti"
-    
+        "inner", "left", "right", "outer", "cross", "semi", "anti", "asof", "interval"
+    - by: Column name(s) that must match exactly for "asof" and "interval" joins
+    - direction: For "asof" joins, which right row to take:
+        "backward" (last value <= left), "forward" (first value >= left), "nearest"
+    - tolerance: For "asof" joins, maximum distance between the matched values
+    - allow_exact_matches: For "asof" joins, whether equal values count as matches
+    - start, end: For "interval" joins, right columns bounding each interval
+    - closed: For "interval" joins, inclusive bounds: "left" ([start, end)), "right",
+        "both", "neither"
+    - bloom: For "semi" and "anti" joins, a bloom_filter() of the right keys used to
+        drop non-matching left rows before the exact membership check
+    - suffixes: Suffixes added to overlapping non-key column names (left, right)
+
+    "asof" joins keep every left row and attach the nearest right row (per by group)
+    on the on/left_on column, like merge_asof() but without requiring sorted input.
+    "interval" joins pair each left row with every right row (per by group) whose
+    [start, end) window contains the left on/left_on value.
+
     Usage:
         df >> join(other_df, on="id", how="left")
         df >> join(other_df, left_on="id", right_on="user_id", how="inner")
+        df >> join(key_set(other_df, on=["id", "day"]), on=["id", "day"], how="semi")
+        df >> join(join_index(dim_df, on="id"), on="id", how="left")
+        df >> join(allow_df, on="id", how="semi", bloom=bloom_filter(allow_df, on="id"))
+        trades >> join(quotes, on="time", by="symbol", how="asof", tolerance=pd.Timedelta("1s"))
+        events >> join(windows, on="time", start="start", end="end", by="user", how="interval")
     """
     def _join(df):
-        # Handle semi join (rows in left that have matches in right)
-        if how == "semi":
+        # Handle as-of joins (nearest right row on an ordered key)
+        if how == "asof":
+            left_key = (on if on is not None else left_on)
+            right_key = (on if on is not None else right_on)
+            left_key = _resolve_key_names(left_key)[0]
+            right_key = _resolve_key_names(right_key)[0]
+            by_cols = _resolve_key_names(by) or []
+
+            right_take = _asof_positions(
+                df[left_key], other[right_key],
+                [df[c] for c in by_cols], [other[c] for c in by_cols],
+                direction=direction, tolerance=tolerance,
+                allow_exact_matches=allow_exact_matches
+            )
+            shared = set(by_cols) | ({left_key} if left_key == right_key else set())
+            return _take_joined(df, np.arange(len(df)), other, right_take, shared, suffixes)
+
+        # Handle interval joins (left value inside a right [start, end) window)
+        if how == "interval":
+            if start is None or end is None:
+                raise ValueError("Interval joins need both start= and end= columns")
+            point = _resolve_key_names(on if on is not None else left_on)[0]
+            start_col = _resolve_key_names(start)[0]
+            end_col = _resolve_key_names(end)[0]
+            by_cols = _resolve_key_names(by) or []
+
+            left_take, right_take = _interval_positions(
+                df[point], other[start_col], other[end_col],
+                [df[c] for c in by_cols], [other[c] for c in by_cols],
+                closed=closed
+            )
+            return _take_joined(df, left_take, other, right_take, set(by_cols), suffixes)
+
+        # Handle semi and anti joins (rows in left with / without matches in right)
+        if how in ("semi", "anti"):
             if on is not None:
-                merge_left = merge_right = on
+                merge_left = merge_right = _resolve_key_names(on)
+            elif left_on is None and right_on is None and isinstance(other, pd.DataFrame):
+                # Default to the shared columns, as merge() does
+                merge_left = merge_right = [c for c in df.columns if c in other.columns]
             else:
-                merge_left = left_on
-                merge_right = right_on
-            
-            return df[df[merge_left].isin(other[merge_right])]
-        
-        # Handle anti join (rows in left that have no matches in right)
-        elif how == "anti":
-            if on is not None:
-                merge_left = merge_right = on
+                merge_left = _resolve_key_names(left_on)
+                merge_right = _resolve_key_names(right_on)
+
+            if isinstance(other, KeySet):
+                merge_left = _align_keys(other, merge_left, merge_right)
+
+            if isinstance(other, BloomFilter):
+                # The filter only holds hashes, so the left key columns must be named
+                if not merge_left:
+                    raise ValueError("on= is required when joining against a BloomFilter")
+
+                # Approximate: a few non-matching rows may pass as matches
+                mask = other.might_contain(df[merge_left])
             else:
-                merge_left = left_on
-                merge_right = right_on
-            
-            return df[~df[merge_left].isin(other[merge_right])]
-        
+                keys = other if isinstance(other, KeySet) else KeySet(other, merge_right)
+
+                if bloom is not None:
+                    # Only rows the filter can't rule out need the exact check
+                    mask = bloom.might_contain(df[merge_left or keys.on])
+                    mask[mask] = keys.contains(df[mask], on=merge_left)
+                else:
+                    mask = keys.contains(df, on=merge_left)
+
+            if how == "anti":
+                mask = ~mask
+
+            return df[mask]
+
+        if isinstance(other, JoinIndex):
+            if how not in ("inner", "left"):
+                raise ValueError("A join_index() supports how='inner', 'left', 'semi' or 'anti'")
+            left_cols = _resolve_key_names(on if on is not None else left_on)
+            if on is None:
+                left_cols = _align_keys(other, left_cols, _resolve_key_names(right_on))
+            return other.join(df, on=left_cols, how=how, suffixes=suffixes)
+
+        if isinstance(other, (KeySet, BloomFilter)):
+            raise ValueError("A key_set() or bloom_filter() can only be used with how='semi' or how='anti'")
+
         # Handle standard pandas joins
-        else:
-            return df.merge(other, on=on, left_on=left_on, right_on=right_on, how=how)
-    
-    return _join
\ No newline at end of file
+        return df.merge(other, on=on, left_on=left_on, right_on=right_on, how=how, suffixes=suffixes)
+
+    return _join
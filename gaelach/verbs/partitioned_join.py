@@ -0,0 +1,182 @@
+from gaelach.verbs.join import join
+from gaelach.utils.keys import _hash_rows, _resolve_key_names
+from gaelach.utils.sources import _iter_chunks, _is_path, _expand_paths
+import pandas as pd
+import numpy as np
+import pyarrow as pa
+import pyarrow.ipc as ipc
+import pyarrow.parquet as pq
+import math
+import os
+import shutil
+import tempfile
+
+_DEFAULT_MEMORY_BUDGET = 1 << 30
+_DEFAULT_PARTITIONS = 64
+
+# Define the partitioned_join() function
+def partitioned_join(left, right, on=None, left_on=None, right_on=None, how="inner",
+                     n_partitions=None, memory_budget=None, chunk_size=1_000_000,
+                     spill_dir=None, sink=None):
+    """
+    Join two tables that don't fit in memory by hash-partitioning them to disk.
+
+    Both inputs are streamed in chunks and split by a hash of their key columns
+    into Arrow IPC spill files, then each pair of partitions is joined in memory
+    on its own with join(). Rows with equal keys always land in the same pair,
+    so the union of the partition results is the full join (in no particular
+    row order).
+
+    left, right: A DataFrame, a Parquet file path or glob pattern, or an
+                 iterable of DataFrame chunks
+    on, left_on, right_on: Key column(s), as in join()
+    how: "inner", "left", "right", "outer", "semi" or "anti"
+    n_partitions: Number of partitions (default: derived from memory_budget)
+    memory_budget: Rough bytes available for joining one partition pair
+                   (default 1 GiB)
+    chunk_size: Rows read per chunk while partitioning
+    spill_dir: Directory for the spill files (default: a temporary directory,
+               removed once the join finishes)
+    sink: Optional directory to write the result to as one Parquet file per
+          partition; the function then returns the directory path
+
+    Returns a generator of DataFrame chunks, or the sink path if sink is set.
+
+    Usage:
+        for chunk in partitioned_join("facts/*.parquet", "orders/*.parquet", on="order_id"):
+            ...
+        partitioned_join(big_df, "dim.parquet", on="id", how="left", sink="out/")
+    """
+    if how not in ("inner", "left", "right", "outer", "semi", "anti"):
+        raise ValueError(
+            "partitioned_join() supports how='inner', 'left', 'right', 'outer', 'semi' or 'anti'"
+        )
+
+    if on is not None:
+        left_keys = right_keys = _resolve_key_names(on)
+    elif left_on is not None and right_on is not None:
+        left_keys = _resolve_key_names(left_on)
+        right_keys = _resolve_key_names(right_on)
+    else:
+        raise ValueError("partitioned_join() needs either on= or both left_on= and right_on=")
+
+    if n_partitions is None:
+        n_partitions = _plan_partitions(left, right, memory_budget or _DEFAULT_MEMORY_BUDGET)
+
+    chunks = _join_partitions(left, right, left_keys, right_keys, on, how,
+                              n_partitions, chunk_size, spill_dir)
+
+    if sink is None:
+        return chunks
+
+    os.makedirs(sink, exist_ok=True)
+    for i, chunk in enumerate(chunks):
+        chunk.to_parquet(os.path.join(sink, f"part-{i:05d}.parquet"), index=False)
+    return sink
+
+def _join_partitions(left, right, left_keys, right_keys, on, how,
+                     n_partitions, chunk_size, spill_dir):
+    """Spill both sides to partition files, then join the pairs one at a time."""
+    directory = spill_dir if spill_dir is not None else tempfile.mkdtemp(prefix="gaelach-join-")
+    os.makedirs(directory, exist_ok=True)
+
+    try:
+        left_paths, left_schema = _spill(left, left_keys, n_partitions, chunk_size,
+                                         os.path.join(directory, "left"))
+        right_paths, right_schema = _spill(right, right_keys, n_partitions, chunk_size,
+                                           os.path.join(directory, "right"))
+
+        joiner_kwargs = {"on": on} if on is not None else {"left_on": left_keys, "right_on": right_keys}
+
+        for part in range(n_partitions):
+            # Partitions without left rows can only contribute to right/outer joins
+            if left_paths[part] is None and how not in ("right", "outer"):
+                continue
+            if right_paths[part] is None and how in ("inner", "semi", "right"):
+                continue
+
+            left_part = _read_partition(left_paths[part], left_schema)
+            right_part = _read_partition(right_paths[part], right_schema)
+
+            result = join(right_part, how=how, **joiner_kwargs)(left_part)
+            if len(result):
+                yield result.reset_index(drop=True)
+    finally:
+        if spill_dir is None:
+            shutil.rmtree(directory, ignore_errors=True)
+
+def _spill(source, keys, n_partitions, chunk_size, prefix):
+    """
+    Hash-partition a source into Arrow IPC files.
+
+    Returns (paths, schema), where paths[i] is None for empty partitions.
+    """
+    writers = {}
+    paths = [None] * n_partitions
+    schema = None
+
+    try:
+        for chunk in _iter_chunks(source, chunk_size):
+            table = pa.Table.from_pandas(chunk, preserve_index=False)
+            if schema is None:
+                schema = table.schema
+            elif not table.schema.equals(schema):
+                table = table.cast(schema)
+
+            if not len(chunk):
+                continue
+
+            # Sort rows by partition so each one is written as a single slice
+            parts = _partition_ids(chunk, keys, n_partitions)
+            order = np.argsort(parts, kind="stable")
+            table = table.take(order)
+            bounds = np.searchsorted(parts[order], np.arange(n_partitions + 1))
+
+            for part in range(n_partitions):
+                start, stop = bounds[part], bounds[part + 1]
+                if start == stop:
+                    continue
+                if part not in writers:
+                    paths[part] = f"{prefix}-{part:05d}.arrow"
+                    # The stream format (unlike the file format) lets categorical
+                    # chunks replace their dictionaries batch by batch
+                    writers[part] = ipc.new_stream(paths[part], schema)
+                writers[part].write_table(table.slice(start, stop - start))
+    finally:
+        for writer in writers.values():
+            writer.close()
+
+    return paths, schema
+
+def _partition_ids(chunk, keys, n_partitions):
+    """Map each row to a partition by hashing its key columns."""
+    hashes = _hash_rows(chunk[keys])
+    return (hashes % np.uint64(n_partitions)).astype(np.int64)
+
+def _read_partition(path, schema):
+    """Load one spilled partition, or an empty frame with the source's columns."""
+    if path is not None:
+        with ipc.open_stream(path) as reader:
+            return reader.read_all().to_pandas()
+    if schema is not None:
+        return schema.empty_table().to_pandas()
+    return pd.DataFrame()
+
+def _plan_partitions(left, right, memory_budget):
+    """Pick a partition count so one partition pair (plus output) fits the budget."""
+    sizes = [_estimate_bytes(left), _estimate_bytes(right)]
+    if None in sizes:
+        return _DEFAULT_PARTITIONS
+    return max(1, math.ceil(3 * sum(sizes) / memory_budget))
+
+def _estimate_bytes(source):
+    """Estimate the in-memory size of a source, or None if unknown."""
+    if isinstance(source, pd.DataFrame):
+        return int(source.memory_usage(deep=True).sum())
+    if _is_path(source):
+        total = 0
+        for path in _expand_paths(source):
+            metadata = pq.ParquetFile(path).metadata
+            total += sum(metadata.row_group(i).total_byte_size for i in range(metadata.num_row_groups))
+        return total
+    return None
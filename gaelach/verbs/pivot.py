@@ -1,10 +1,38 @@
 from gaelach.core.symbolic import SymbolicAttr, DeSelect, ColumnRange
+from gaelach.utils.keys import _encode, _combine_codes
 import pandas as pd
+import numpy as np
+
+def _is_masked(s):
+    """Check if a Series holds nullable (masked) numbers or booleans."""
+    return isinstance(s.dtype, pd.api.extensions.ExtensionDtype) and s.dtype.kind in "iufb"
+
+def _single_sum(s):
+    """The sum of a single value, as groupby() gives it: missing is 0, booleans count."""
+    if s.dtype.kind not in "iufb":
+        return s
+    if s.dtype.kind == "b":
+        s = s.astype("Int64" if _is_masked(s) else "int64")
+    if s.dtype.kind == "f" or _is_masked(s):
+        s = s.fillna(0)
+    return s
+
+# Aggregations the grid pivot supports, with their result for a single value
+_GRID_AGGS = {
+    "first": lambda s: s,
+    "last": lambda s: s,
+    "mean": lambda s: s.astype("Float64" if _is_masked(s) else "float64") if s.dtype.kind in "iub" else s,
+    "median": lambda s: s.astype("Float64" if _is_masked(s) else "float64") if s.dtype.kind in "iub" else s,
+    "min": lambda s: s,
+    "max": lambda s: s,
+    "sum": _single_sum,
+    "count": lambda s: s.notna().astype("Int64" if _is_masked(s) else "int64"),
+}
 
 # Define the pivot_wider() verb
 def pivot_wider(names_from, values_from=None, id_cols=None, 
                 values_fill=None, values_fn="first", names_sep="_",
-                names_prefix="", sort_columns=False):
+                names_prefix="", sort_columns=False, sparse=False):
     """
     Pivot DataFrame from long to wide format.
     
@@ -16,9 +44,13 @@ def pivot_wider(names_from, values_from=None, id_cols=None,
     names_sep: Separator when multiple values_from columns create compound names
     names_prefix: Prefix to add to all pivoted column names
     sort_columns: Whether to sort the pivoted columns alphabetically
+    sparse: Whether to return the pivoted columns as pandas sparse columns, storing
+            only the combinations that occur (values_fill, or NaN, is the fill value)
     
     Usage:
         df >> pivot_wider(names_from=_.category, values_from=_.value, id_cols=_.id)
+        df >> pivot_wider(names_from=_.item, values_from=_.qty, id_cols=_.basket,
+                          values_fill=0, sparse=True)
     """
     def _pivot_wider(df):
         # Convert symbolic references to column names
@@ -53,14 +85,25 @@ def pivot_wider(names_from, values_from=None, id_cols=None,
         }
         agg_func = agg_map.get(values_fn, values_fn)
         
-        # Perform the pivot
-        result = df.pivot_table(
-            index=id_columns if id_columns else None,
-            columns=names_col,
-            values=value_columns if value_columns else None,
-            aggfunc=agg_func,
-            fill_value=values_fill
-        )
+        # Perform the pivot, scattering into a preallocated grid where possible
+        result = None
+        if id_columns and value_columns and agg_func in _GRID_AGGS:
+            result = _pivot_grid(df, id_columns, names_col, value_columns, agg_func, 
+                                 values_fill, sparse=sparse)
+        
+        if result is None:
+            result = df.pivot_table(
+                index=id_columns if id_columns else None,
+                columns=names_col,
+                values=value_columns if value_columns else None,
+                aggfunc=agg_func,
+                fill_value=values_fill
+            )
+            if sparse:
+                fill = np.nan if values_fill is None else values_fill
+                result = result.astype({
+                    col: pd.SparseDtype(result[col].dtype, fill) for col in result.columns
+                })
         
         # Flatten multi-level column names if present
         if isinstance(result.columns, pd.MultiIndex):
@@ -92,19 +135,25 @@ def pivot_wider(names_from, values_from=None, id_cols=None,
 
 # Define the pivot_longer() verb
 def pivot_longer(cols=None, names_to="name", values_to="value", 
-                 cols_vary="fastest"):
+                 cols_vary="fastest", names_sep=None, names_pattern=None):
     """
     Pivot DataFrame from wide to long format.
     
     cols: Column(s) to pivot into longer format (if None, pivots all columns)
           Can use _.col, [_.col1, _.col2], ~_.col for exclusion, or _.col1 | _.col2 for ranges
-    names_to: Name for the new column containing former column names
+    names_to: Name for the new column containing former column names, or a list of
+              names when names_sep or names_pattern splits them into several columns
     values_to: Name for the new column containing the values
     cols_vary: Not implemented yet (for future compatibility with tidyr)
+    names_sep: Separator to split the former column names on
+    names_pattern: Regular expression whose groups extract the name parts
+    
+    The name column(s) are returned as categoricals, one category per pivoted column.
     
     Usage:
         df >> pivot_longer(cols=[_.cat1, _.cat2, _.cat3], names_to="category", values_to="value")
         df >> pivot_longer(cols=~_.id, names_to="variable", values_to="measurement")
+        df >> pivot_longer(cols=~_.time, names_to=["sensor", "unit"], names_sep="_")
     """
     def _pivot_longer(df):
         # Handle column selection
@@ -115,18 +164,278 @@ def pivot_longer(cols=None, names_to="name", values_to="value",
         else:
             cols_to_pivot, id_cols = _resolve_pivot_cols(cols, df)
         
-        # Perform the melt
-        result = df.melt(
-            id_vars=id_cols,
-            value_vars=cols_to_pivot,
-            var_name=names_to,
-            value_name=values_to
-        )
+        names = [names_to] if isinstance(names_to, str) else list(names_to)
+        if not cols_to_pivot:
+            return df.melt(id_vars=id_cols, value_vars=cols_to_pivot,
+                           var_name=names[0], value_name=values_to)
         
-        return result
+        n_rows = len(df)
+        n_cols = len(cols_to_pivot)
+        
+        # Each value column contributes one block of rows, in column order
+        result = {}
+        for col in id_cols or []:
+            values = df[col].array
+            if isinstance(values, pd.arrays.NumpyExtensionArray):
+                result[col] = np.tile(values.to_numpy(), n_cols)
+            else:
+                result[col] = values.take(np.tile(np.arange(n_rows), n_cols))
+        
+        # Name columns are categoricals: one category per pivoted column, repeated codes
+        for name, (codes, categories) in zip(
+            names, _name_parts(cols_to_pivot, names, names_sep, names_pattern)
+        ):
+            codes = codes.astype(np.int8 if len(categories) < 127 else np.int32)
+            result[name] = pd.Categorical.from_codes(np.repeat(codes, n_rows), categories=categories)
+        
+        result[values_to] = _stack_values(df, cols_to_pivot)
+        
+        return pd.DataFrame(result, copy=False)
     
     return _pivot_longer
 
+def _name_parts(columns, names, names_sep, names_pattern):
+    """
+    Split pivoted column labels into name parts.
+
+    Only the labels themselves are split, once each, so the work doesn't grow
+    with the number of rows.
+
+    Returns one (codes, categories) pair per entry of names, where codes maps
+    each pivoted column to its category (-1 for a missing part).
+    """
+    labels = pd.Series(list(columns), dtype=object)
+    
+    if names_sep is not None and names_pattern is not None:
+        raise ValueError("Use either names_sep or names_pattern, not both")
+    
+    if names_pattern is not None:
+        parts = labels.astype(str).str.extract(names_pattern)
+        if parts.shape[1] != len(names):
+            raise ValueError(
+                f"names_pattern has {parts.shape[1]} group(s) but names_to has {len(names)} name(s)"
+            )
+    elif names_sep is not None:
+        parts = labels.astype(str).str.split(names_sep, n=len(names) - 1, expand=True, regex=False)
+        parts = parts.reindex(columns=range(len(names)))
+    elif len(names) == 1:
+        parts = labels.to_frame()
+    else:
+        raise ValueError("Several names_to columns need names_sep or names_pattern")
+    
+    return [pd.factorize(parts.iloc[:, i]) for i in range(len(names))]
+
+def _stack_values(df, columns):
+    """Stack value columns end to end, with one concatenate when their dtypes agree."""
+    dtypes = {df[col].dtype for col in columns}
+    dtype = next(iter(dtypes))
+    if len(dtypes) == 1 and isinstance(dtype, np.dtype):
+        return np.concatenate([df[col].to_numpy() for col in columns])
+    
+    # Mixed or extension dtypes are combined by concat(), which finds the common dtype
+    return pd.concat([df[col] for col in columns], ignore_index=True)
+
+def _pivot_grid(df, id_columns, names_col, value_columns, agg_func, values_fill, sparse=False):
+    """
+    Pivot by scattering values into a preallocated (rows x names) grid.
+
+    Row and column positions come from factorized id and names codes. When every
+    (id, name) pair is unique the values are placed directly; otherwise they are
+    first reduced with groupby's native aggregation kernels. The result has the
+    same shape, order and dtypes as the equivalent pivot_table() call, except
+    that a values_fill a nullable column can't hold (1.5 among nullable
+    booleans) upcasts it to object instead of being converted.
+
+    With sparse=True each pivoted column is built as a SparseArray from the
+    pairs that occur, one column at a time, so the dense grid is never
+    materialized. Nullable values are held as object or float64, with NaN
+    for missing values.
+
+    Returns None if the pivot can't be done this way.
+    """
+    single_id = not isinstance(id_columns, list)
+    id_list = [id_columns] if single_id else id_columns
+    single_value = not isinstance(value_columns, list)
+    value_list = [value_columns] if single_value else value_columns
+    try:
+        # Value columns come out in sorted order, as with pivot_table()
+        value_list = sorted(value_list)
+    except TypeError:
+        pass
+    
+    if isinstance(names_col, list) or names_col in id_list:
+        return None
+    
+    # Factorize id rows (in sorted order) and names
+    id_codes = []
+    id_sizes = []
+    for col in id_list:
+        codes, uniques = _encode(df[col])
+        id_codes.append(codes)
+        id_sizes.append(len(uniques))
+    row_key, row_size = _combine_codes(id_codes, id_sizes)
+    names_codes, names_uniques = _encode(df[names_col])
+    n_names = len(names_uniques)
+    
+    # Rows with a missing key are dropped, as groupby() does
+    keep = names_codes >= 0
+    for codes in id_codes:
+        keep &= codes >= 0
+    positions = np.flatnonzero(keep)
+    cell_key = row_key[positions] * n_names + names_codes[positions]
+    
+    # Reduce each (id, name) pair to one value
+    values = df[value_list].iloc[positions].reset_index(drop=True)
+    if row_size * n_names <= 4 * len(df) + 1024:
+        unique_cells = np.bincount(cell_key, minlength=1).max(initial=0) <= 1
+    else:
+        unique_cells = pd.Index(cell_key).is_unique
+    
+    if unique_cells:
+        cells = pd.DataFrame({col: _GRID_AGGS[agg_func](values[col]) for col in value_list})
+        cell_pos = positions
+    else:
+        grouped = values.groupby(cell_key, sort=False)
+        cells = grouped.agg(agg_func).reset_index(drop=True)
+        cell_pos = positions[grouped.ngroup().drop_duplicates().index.to_numpy()]
+    
+    # Drop pairs whose values are all missing, as pivot_table() does
+    present = cells.notna().any(axis=1).to_numpy()
+    cells = cells[present].reset_index(drop=True)
+    cell_pos = cell_pos[present]
+    
+    # Lay out rows and columns in sorted key order
+    row_codes, n_rows = _dense_codes(row_key[cell_pos], row_size)
+    col_codes, used = _dense_codes(names_codes[cell_pos], n_names, return_used=True)
+    col_names = names_uniques[used]
+    n_cols = len(col_names)
+    flat = row_codes.astype(np.int64) * n_cols + col_codes
+    
+    # One representative source row per output row gives the id values
+    first = np.full(n_rows, -1, dtype=np.int64)
+    first[row_codes[::-1]] = cell_pos[::-1]
+    id_frame = df[id_list].iloc[first]
+    if single_id:
+        index = pd.Index(id_frame[id_columns].to_numpy(), name=id_columns, dtype=df[id_columns].dtype)
+    else:
+        index = pd.MultiIndex.from_frame(id_frame)
+    
+    missing = len(flat) < n_rows * n_cols
+    
+    if sparse:
+        blocks = [_sparse_block(cells[col], row_codes, col_codes, n_rows, n_cols, index, values_fill)
+                  for col in value_list]
+    else:
+        blocks = [_dense_block(cells[col], flat, n_rows, n_cols, index, values_fill, missing)
+                  for col in value_list]
+    
+    if single_value:
+        result = blocks[0]
+        result.columns = pd.Index(col_names, name=names_col)
+    else:
+        result = pd.concat(blocks, axis=1)
+        result.columns = pd.MultiIndex.from_product(
+            [value_list, col_names], names=[None, names_col]
+        )
+    
+    return result
+
+def _dense_block(cell_values, flat, n_rows, n_cols, index, values_fill, missing):
+    """Scatter one value column's cells into a dense (rows x names) frame."""
+    dtype = cell_values.dtype
+    if missing and values_fill is not None:
+        dtype, values_fill = _fit_fill(dtype, values_fill)
+    numeric = isinstance(dtype, np.dtype) and dtype.kind in "iuf"
+    
+    grid = np.full(n_rows * n_cols, np.nan, dtype=np.float64 if numeric else object)
+    grid[flat] = cell_values.to_numpy(dtype=grid.dtype)
+    block = pd.DataFrame(grid.reshape(n_rows, n_cols), index=index)
+    if values_fill is not None:
+        block = block.fillna(values_fill)
+    
+    # Restore the value dtype unless missing pairs forced an upcast: NumPy
+    # bools and integers can't hold the gaps (bool(nan) would read as True),
+    # so they stay object or float, as with pivot_table()
+    holds_missing = isinstance(dtype, pd.api.extensions.ExtensionDtype) or dtype.kind not in "biu"
+    if not missing or values_fill is not None or holds_missing:
+        try:
+            block = block.astype(dtype)
+        except (TypeError, ValueError):
+            pass
+    return block
+
+def _sparse_block(cell_values, row_codes, col_codes, n_rows, n_cols, index, values_fill):
+    """Build one value column's cells as a frame of sparse (rows x names) columns."""
+    fill = np.nan if values_fill is None else values_fill
+    if values_fill is not None:
+        cell_values = cell_values.fillna(values_fill)
+    
+    dtype = cell_values.dtype
+    if values_fill is not None:
+        dtype, _ = _fit_fill(dtype, values_fill)
+    if isinstance(dtype, pd.api.extensions.ExtensionDtype) or dtype.kind not in "iufb":
+        dtype = np.dtype(object)
+    elif values_fill is None and dtype.kind in "iub":
+        # Missing pairs are NaN, so integer and boolean values need floats
+        dtype = np.dtype(np.float64)
+    sparse_dtype = pd.SparseDtype(dtype, fill)
+    values = cell_values.to_numpy(dtype=dtype)
+    
+    # Sort cells by (name, row) so each column's cells are one contiguous run
+    order = np.argsort(col_codes.astype(np.int64) * n_rows + row_codes, kind="stable")
+    bounds = np.searchsorted(col_codes[order], np.arange(n_cols + 1))
+    rows = row_codes[order].astype(np.int32)
+    values = values[order]
+    
+    columns = {}
+    for j in range(n_cols):
+        start, stop = bounds[j], bounds[j + 1]
+        # Scatter one column at a time, so only a single dense column is
+        # ever held next to the sparse ones
+        dense = np.full(n_rows, fill, dtype=dtype)
+        dense[rows[start:stop]] = values[start:stop]
+        columns[j] = pd.arrays.SparseArray(dense, fill_value=fill, dtype=sparse_dtype)
+    
+    return pd.DataFrame(columns, index=index)
+
+def _fit_fill(dtype, values_fill):
+    """
+    Fit values_fill to a value column's dtype, as pivot_table() does.
+
+    NumPy dtypes are upcast as setting the fill into a Series would (0 among
+    bools gives object, 1.5 among integers gives float64). Extension dtypes
+    take the fill converted to their type when nothing is lost (0 as False
+    among nullable booleans).
+
+    Returns a (dtype, values_fill) tuple.
+    """
+    if isinstance(dtype, np.dtype):
+        return pd.Series(np.zeros(1, dtype=dtype)).where(np.zeros(1, dtype=bool), values_fill).dtype, values_fill
+    try:
+        cast = pd.array([values_fill]).astype(dtype)[0]
+        return dtype, (cast if cast == values_fill else values_fill)
+    except (TypeError, ValueError):
+        return dtype, values_fill
+
+def _dense_codes(codes, size, return_used=False):
+    """
+    Renumber non-negative codes to 0..k-1, keeping their order.
+
+    size: Upper bound on the codes; small code spaces are compacted with a
+          lookup table instead of a sort
+    return_used: If True, also return a boolean mask of the codes that occur
+                 (requires size to fit in memory)
+
+    Returns (dense codes, k) or (dense codes, used mask).
+    """
+    if return_used or size <= 4 * len(codes) + 1024:
+        used = np.zeros(size, dtype=bool)
+        used[codes] = True
+        dense = (np.cumsum(used) - 1)[codes]
+        return dense, (used if return_used else int(used.sum()))
+    
+    dense, uniques = pd.factorize(codes, sort=True)
+    return dense, len(uniques)
 
 def _resolve_columns(cols, df, single=False):
     """
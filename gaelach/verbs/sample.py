@@ -1,27 +1,242 @@
 from gaelach.core.symbolic import SymbolicAttr
+from gaelach.utils.alias import AliasTable, _weight_values
+from gaelach.utils.groups import _ungroup, _group_positions
+from gaelach.utils.keys import _resolve_key_names
+from gaelach.utils.sorting import _sort_order
+from gaelach.utils.sources import _iter_chunks
+from gaelach.verbs.distinct import _distinct_key
+import pandas as pd
+import numpy as np
 
-def sample(n=None, frac=None, with_replacement=False, shuffle=False, seed=None):
+def sample(n=None, frac=None, with_replacement=False, shuffle=False, seed=None, weights=None):
     """
     Sample rows from a DataFrame.
-    
-    n: Number of rows to sample (integer)
-    frac: Fraction of rows to sample (float between 0 and 1)
+
+    n: Number of rows to sample (integer; per group on grouped input)
+    frac: Fraction of rows to sample (float between 0 and 1; per group on grouped input)
     with_replacement: Whether to sample with replacement (default False)
-    shuffle: Whether to shuffle before sampling (default False)
-    seed: Random seed for reproducibility
-    
-    Returns a function that samples from a DataFrame when piped.
-    
-    Usage: df >> sample(n=10) or df >> sample(frac=0.1)
+    shuffle: Whether to return the sampled rows in random order (default False
+             keeps their original order, group by group on grouped input)
+    seed: Random seed (or numpy Generator) for reproducibility
+    weights: Column name, symbolic column or expression giving each row's
+             sampling weight, an array of weights, or a prebuilt alias_table()
+
+    With neither n nor frac, one row is drawn (or every row, when shuffling).
+
+    Grouped input is sampled per group in a few vectorized passes over the
+    group codes (stratified sampling); a per-group n larger than a group takes
+    the whole group when sampling without replacement. Rows with a missing
+    group key belong to no group and are never drawn.
+
+    Weighted draws with replacement go through an alias table (O(1) per draw);
+    weighted draws without replacement keep the rows with the smallest
+    exponential(1) / weight keys.
+
+    Returns a function that samples from a DataFrame or GroupBy when piped.
+
+    Usage: df >> sample(n=10) or df >> group_by(_.country) >> sample(frac=0.01, seed=42)
+    """
+    if n is not None and frac is not None:
+        raise ValueError("sample() takes n or frac, not both")
+    if n is None and frac is None:
+        n, frac = (None, 1.0) if shuffle else (1, None)
+
+    def _sample(df_or_group):
+        df, codes, n_groups = _ungroup(df_or_group)
+        rng = np.random.default_rng(seed)
+        w = weights if weights is None or isinstance(weights, AliasTable) else _weight_values(df, weights)
+        if isinstance(w, AliasTable) and len(w) != len(df):
+            raise ValueError(f"The alias table covers {len(w)} rows but the DataFrame has {len(df)}")
+
+        if codes is None:
+            size = len(df)
+            k = n if frac is None else int(round(frac * size))
+            if k > size and not with_replacement:
+                raise ValueError("Cannot take a larger sample than the population without replacement")
+            rows = _draw_rows(size, k, with_replacement, w, rng)
+            if not shuffle:
+                rows = np.sort(rows)
+        else:
+            rows = _draw_groups(codes, n_groups, n, frac, with_replacement, w, rng)
+            if not shuffle:
+                # Group by group, in original order within each group
+                rows = np.sort(rows)
+                rows = rows[np.argsort(codes[rows], kind="stable")]
+
+        if shuffle:
+            rows = rng.permutation(rows)
+        return df.take(rows)
+
+    return _sample
+
+def sample_chunks(source, n=None, frac=None, by=None, weights=None, seed=None, chunk_size=1_000_000):
+    """
+    Sample rows from a stream of chunks without holding the stream in memory.
+
+    source: A DataFrame, a Parquet file path or glob pattern, or an iterable
+            of DataFrame chunks
+    n: Number of rows to keep (per group of by=, if given), by reservoir sampling
+    frac: Probability of keeping each row (independent Bernoulli draws)
+    by: Column name(s) to stratify the n-row reservoir by (rows with a
+        missing key are left out, as group_by() drops them)
+    weights: Column name, symbolic column or expression giving each row's
+             weight (with n only)
+    seed: Random seed (or numpy Generator) for reproducibility
+    chunk_size: Rows read per chunk from DataFrame and Parquet sources
+
+    Every row gets a random key as it streams past (uniform, or
+    exponential(1) / weight when weighted), and the reservoir holds the n rows
+    with the smallest keys seen so far. Keys are drawn in row order from one
+    generator, so a given seed picks the same rows however the stream is chunked.
+
+    Returns a DataFrame of the sampled rows, in stream order.
+
+    Usage:
+        sample_chunks("events/*.parquet", frac=0.01, seed=7)
+        sample_chunks(reader, n=1000, by="country", seed=7)
+    """
+    if (n is None) == (frac is None):
+        raise ValueError("sample_chunks() takes either n or frac")
+    if frac is not None and (by is not None or weights is not None):
+        raise ValueError("by= and weights= are only supported with n")
+
+    rng = np.random.default_rng(seed)
+    by = _resolve_key_names(by)
+    kept = []
+    reservoir, keys, stream_pos = None, np.zeros(0), np.zeros(0, dtype=np.int64)
+    seen = 0
+
+    for chunk in _iter_chunks(source, chunk_size):
+        if frac is not None:
+            mask = rng.random(len(chunk)) < frac
+            kept.append(chunk.take(np.flatnonzero(mask)))
+            continue
+
+        if weights is None:
+            draws = rng.random(len(chunk))
+        else:
+            draws = _weighted_keys(_weight_values(chunk, weights), rng)
+
+        # Without strata, only rows beating the current n-th key can get in;
+        # with strata, rows with a missing key belong to none (as in groupby())
+        candidates = np.arange(len(chunk))
+        if by is not None:
+            candidates = np.flatnonzero(chunk[by].notna().all(axis=1).to_numpy())
+        elif 0 < n == len(keys):
+            candidates = np.flatnonzero(draws < keys.max())
+
+        pool = chunk.take(candidates) if reservoir is None else \
+            pd.concat([reservoir, chunk.take(candidates)])
+        pool_keys = np.concatenate([keys, draws[candidates]])
+        pool_pos = np.concatenate([stream_pos, seen + candidates])
+        seen += len(chunk)
+
+        if by is None:
+            best = np.argpartition(pool_keys, n - 1)[:n] if 0 < n < len(pool_keys) else \
+                np.arange(len(pool_keys) if n > 0 else 0)
+        else:
+            codes = _distinct_key([pool[col] for col in by])
+            codes, uniques = pd.factorize(codes)
+            best = _smallest_per_group(codes, len(uniques), pool_keys, n)
+
+        reservoir, keys, stream_pos = pool.take(best), pool_keys[best], pool_pos[best]
+
+    if frac is not None:
+        return pd.concat(kept) if kept else pd.DataFrame()
+    if reservoir is None:
+        return pd.DataFrame()
+    return reservoir.take(np.argsort(stream_pos, kind="stable"))
+
+def _draw_rows(size, k, with_replacement, weights, rng):
+    """Draw k row positions out of size, optionally weighted."""
+    if weights is None:
+        return rng.choice(size, k, replace=with_replacement)
+
+    if with_replacement:
+        table = weights if isinstance(weights, AliasTable) else AliasTable(weights)
+        return table.draw(k, rng)
+
+    if isinstance(weights, AliasTable):
+        weights = weights.weights
+    if k > np.count_nonzero(weights):
+        raise ValueError("Fewer rows with a non-zero weight than the sample size")
+    keys = _weighted_keys(weights, rng)
+    return np.argpartition(keys, k - 1)[:k] if 0 < k < size else np.flatnonzero(keys < np.inf)[:k]
+
+def _draw_groups(codes, n_groups, n, frac, with_replacement, weights, rng):
+    """Draw n rows, or frac of the rows, from every group at once."""
+    counts = np.bincount(codes[codes >= 0], minlength=n_groups)
+    if frac is not None:
+        k = np.round(counts * frac).astype(np.int64)
+    else:
+        k = np.full(n_groups, n, dtype=np.int64)
+    if isinstance(weights, AliasTable):
+        weights = weights.weights
+
+    if not with_replacement and weights is not None:
+        # Weighted: the k smallest exponential(1) / weight keys of each group
+        positive = np.bincount(codes[codes >= 0], weights=weights[codes >= 0] > 0, minlength=n_groups)
+        k = np.minimum(k, positive.astype(np.int64))
+        keys = _weighted_keys(weights, rng)
+        order, rank, _ = _group_positions(codes, n_groups, _sort_order([codes, keys], stable=True))
+        return order[rank < k[codes[order]]]
+
+    # Rows laid out group by group (counting sort): group g is order[starts[g]:starts[g] + counts[g]]
+    order, _, _ = _group_positions(codes, n_groups)
+    starts = np.cumsum(counts) - counts
+
+    if not with_replacement:
+        return order[_distinct_offsets(starts, counts, np.minimum(k, counts), rng)]
+
+    group = np.repeat(np.arange(n_groups), k)
+    if weights is None:
+        offsets = (rng.random(len(group)) * counts[group]).astype(np.int64)
+        return order[starts[group] + offsets]
+
+    # Inverse CDF over the cumulative weights of each group's rows
+    cumulative = np.cumsum(weights[order])
+    before = np.concatenate(([0.0], cumulative))[starts]
+    totals = np.concatenate(([0.0], cumulative))[starts + counts] - before
+    if (totals[k > 0] <= 0).any():
+        raise ValueError("Every sampled group needs a non-zero total weight")
+    targets = before[group] + rng.random(len(group)) * totals[group]
+    found = np.searchsorted(cumulative, targets, side="right")
+    return order[np.clip(found, starts[group], starts[group] + counts[group] - 1)]
+
+def _distinct_offsets(starts, counts, k, rng):
+    """
+    Pick k distinct positions uniformly from each group's slice starts:starts + counts.
+
+    Positions are drawn with replacement and duplicates redrawn, which
+    converges quickly because no group picks more than half its slice: groups
+    asked for more pick the rows to leave out instead. Returns a boolean mask
+    over the laid-out rows.
     """
-    def _sample(df):
-
-        result = df.sample(n=n, frac=frac, replace=with_replacement, 
-                          random_state=seed)
-        
-        # If shuffle=True and no sampling, just shuffle all rows
-        if shuffle and n is None and frac is None:
-            result = df.sample(frac=1.0, random_state=seed)
-        return result
-    
-    return _sample
\ No newline at end of file
+    n_groups = len(counts)
+    inverted = k > counts // 2
+    wanted = np.where(inverted, counts - k, k)
+
+    picked = np.zeros(0, dtype=np.int64)
+    missing = wanted
+    while missing.any():
+        group = np.repeat(np.arange(n_groups), missing)
+        draws = starts[group] + (rng.random(len(group)) * counts[group]).astype(np.int64)
+        picked = np.unique(np.concatenate([picked, draws]))
+        missing = wanted - np.bincount(np.searchsorted(starts, picked, side="right") - 1,
+                                       minlength=n_groups)
+
+    mask = np.zeros(counts.sum(), dtype=bool)
+    mask[picked] = True
+    # Flip the groups that picked the rows to leave out
+    mask ^= np.repeat(inverted, counts)
+    return mask
+
+def _weighted_keys(weights, rng):
+    """Random keys whose k smallest are a weighted sample without replacement."""
+    with np.errstate(divide="ignore"):
+        return rng.exponential(size=len(weights)) / weights
+
+def _smallest_per_group(codes, n_groups, keys, n):
+    """Positions of the n rows with the smallest keys in each group."""
+    order, rank, _ = _group_positions(codes, n_groups, _sort_order([codes, keys], stable=True))
+    return order[rank < n]
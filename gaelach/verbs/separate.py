@@ -1,8 +1,12 @@
 from gaelach.core.symbolic import SymbolicAttr
+from gaelach.utils.strings import (
+    _to_strings, _from_strings, _count_parts, _split_parts, _extract_parts, _convert_strings
+)
 import pandas as pd
 import warnings
 
-def separate(col, into, sep, regex=False, drop=True, fill="right"):
+def separate(col, into, sep=None, regex=False, drop=True, fill="right",
+             pattern=None, convert=False):
     """
     Split one column into multiple columns.
     
@@ -12,79 +16,83 @@ def separate(col, into, sep, regex=False, drop=True, fill="right"):
     regex: Whether sep is a regex pattern (default False)
     drop: Whether to drop source column (default True)
     fill: How to handle too few splits - "right", "left", or "error" (default "right")
+    pattern: Regex whose capture groups become the new columns, in order (instead of sep);
+             rows that don't match get missing values
+    convert: Whether to parse the new columns to integer, float or datetime dtypes
+             where every value allows it (default False)
     
     Returns a function that takes a DataFrame and returns the modified DataFrame
     
-    Usage: df >> separate(_.col, into=["a", "b"], sep="_")
+    Usage: 
+        df >> separate(_.col, into=["a", "b"], sep="_")
+        df >> separate(_.id, into=["site", "num"], pattern=r"(?P<site>[A-Z]+)-(?P<num>\d+)", convert=True)
     """
     def _separate(df):
         # Extract column name
         col_name = col.name if isinstance(col, SymbolicAttr) else col
         
-        # Create a copy to avoid modifying original
-        result = df.copy()
-        
         # Get column index for reordering later
-        col_idx = result.columns.get_loc(col_name)
-        
-        # Split the column
-        split_data = result[col_name].str.split(sep, regex=regex, expand=True)
+        col_idx = df.columns.get_loc(col_name)
         
-        # Check split counts and warn if mismatched
-        split_lengths = split_data.notna().sum(axis=1)
-        max_len = split_lengths.max()
-        min_len = split_lengths.min()
+        strings = _to_strings(df[col_name])
         expected_len = len(into)
         
-        if max_len > expected_len:
-            warnings.warn(
-                f"Some splits produced {max_len} parts but only {expected_len} columns requested. "
-                f"Extra parts will be ignored."
-            )
+        if pattern is not None:
+            # Pull out every capture group in one pass
+            parts = _extract_parts(strings, pattern)
+            if len(parts) != expected_len:
+                raise ValueError(
+                    f"pattern has {len(parts)} capture group(s) but {expected_len} columns requested"
+                )
+        elif sep is None:
+            raise ValueError("separate() needs either sep or pattern")
+        else:
+            # Count the parts per row without splitting (missing values have none)
+            split_lengths = _count_parts(strings, sep, regex=regex)
+            max_len = split_lengths.max(initial=0)
+            min_len = split_lengths.min(initial=0)
         
-        if min_len < expected_len and fill == "error":
-            raise ValueError(
-                f"Some splits produced fewer than {expected_len} parts. "
-                f"Use fill='right' or fill='left' to handle this."
-            )
+            # Check split counts and warn if mismatched
+            if max_len > expected_len:
+                warnings.warn(
+                    f"Some splits produced {max_len} parts but only {expected_len} columns requested. "
+                    f"Extra parts will be ignored."
+                )
         
-        # Handle fill strategies
-        if fill == "left":
-            # Align columns to the right
-            for i, col_name_new in enumerate(into):
-                # Calculate which split column to pull from (counting from right)
-                idx = split_data.shape[1] - expected_len + i
-                if idx >= 0 and idx < split_data.shape[1]:
-                    result[col_name_new] = split_data.iloc[:, idx]
-                else:
-                    result[col_name_new] = None
-        else:  # "right" or "error"
-            # Take first n columns from split
-            for i, col_name_new in enumerate(into):
-                if i < split_data.shape[1]:
-                    result[col_name_new] = split_data.iloc[:, i]
-                else:
-                    result[col_name_new] = None
+            if min_len < expected_len and fill == "error":
+                raise ValueError(
+                    f"Some splits produced fewer than {expected_len} parts. "
+                    f"Use fill='right' or fill='left' to handle this."
+                )
         
-        # Reorder columns to insert new ones after original
-        original_cols = list(df.columns)
+            # Handle fill strategies
+            if fill == "left":
+                # Align columns to the right of the widest split
+                positions = range(max_len - expected_len, max_len)
+                max_splits = None
+            else:  # "right" or "error"
+                # Only the first expected_len parts are kept, so stop splitting there
+                positions = range(expected_len)
+                max_splits = expected_len
         
-        if drop:
-            # Remove source column and insert new ones at its position
-            reordered = (
-                original_cols[:col_idx] + 
-                into + 
-                original_cols[col_idx + 1:]
-            )
-        else:
-            # Insert new columns after source column
-            reordered = (
-                original_cols[:col_idx + 1] + 
-                into + 
-                original_cols[col_idx + 1:]
-            )
+            # Positions past the widest split have no parts at all
+            parts = _split_parts(strings, sep, [i for i in positions if 0 <= i < max_len],
+                                 regex=regex, max_splits=max_splits)
+            padding = [None] * (expected_len - len(parts))
+            parts = padding + parts if fill == "left" else parts + padding
+        
+        convert_part = _convert_strings if convert else _from_strings
+        new_cols = pd.DataFrame({
+            col_name_new: convert_part(part) if part is not None else None
+            for col_name_new, part in zip(into, parts)
+        }, index=df.index)
         
-        result = result[reordered]
+        # Insert the new columns at the source column, replacing it if dropping
+        after = col_idx if drop else col_idx + 1
+        result = pd.concat(
+            [df.iloc[:, :after], new_cols, df.iloc[:, col_idx + 1:]],
+            axis=1
+        )
         
         return result
     
@@ -1,4 +1,5 @@
 from gaelach.core.symbolic import SymbolicAttr
+from gaelach.utils.groups import _ungroup, _slice_groups
 
 # Define the slice() verb
 def slice(*args):
@@ -9,12 +10,27 @@ def slice(*args):
     - slice(5) returns first 5 rows
     - slice(5, 10) returns rows 5-14 (10 rows starting at index 5)
     - slice(-5) returns last 5 rows
+    - group_by(_.customer) >> slice(3) returns the first 3 rows of each group
     
     args: Either (n) for first/last n rows, or (offset, n) for n rows starting at offset
     
-    Returns a function that applies the slice to a DataFrame
+    On grouped input the positions count within each group, worked out from the
+    group codes in one pass; rows come back group by group, in their original
+    order within each group.
+    
+    Returns a function that applies the slice to a DataFrame or GroupBy
     """
-    def _slice(df):
+    def _slice(df_or_group):
+        df, codes, n_groups = _ungroup(df_or_group)
+        if codes is not None:
+            if len(args) == 1:
+                start, stop = (0, args[0]) if args[0] >= 0 else (args[0], None)
+            elif len(args) == 2:
+                start, stop = args[0], args[0] + args[1]
+            else:
+                raise ValueError("slice() takes 1 or 2 arguments")
+            return df.take(_slice_groups(codes, n_groups, start, stop))
+        
         if len(args) == 1:
             n = args[0]
             # .iloc[] uses integer position-based indexing
@@ -27,4 +43,10 @@ def slice(*args):
         else:
             raise ValueError("slice() takes 1 or 2 arguments")
     
+    # Lets a preceding arrange() fuse with this into a top_k()
+    if len(args) == 1 and args[0] >= 0:
+        _slice._limit = (0, args[0])
+    elif len(args) == 2 and args[0] >= 0 and args[1] >= 0:
+        _slice._limit = tuple(args)
+    
     return _slice
\ No newline at end of file
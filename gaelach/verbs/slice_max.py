@@ -0,0 +1,82 @@
+from gaelach.utils.groups import _ungroup, _group_positions
+from gaelach.utils.sorting import _sort_values, _sort_key, _sort_order
+import numpy as np
+
+# Define the slice_max() verb
+def slice_max(order_by, n=1, with_ties=True):
+    """
+    Select the rows with the largest values of a column or expression.
+
+    order_by: Column name, symbolic column or symbolic expression to rank by
+    n: Number of rows to keep (per group on grouped input; default: 1)
+    with_ties: If True (default), also keep rows tied with the n-th row, so
+               more than n rows may come back
+
+    Missing values rank last. Rows come back in descending order of order_by,
+    group by group on grouped input.
+
+    Usage:
+        df >> slice_max(_.score, n=3)
+        df >> group_by(_.customer) >> slice_max(_.amount, n=3, with_ties=False)
+    """
+    return _slice_extreme(order_by, n, with_ties, descending=True)
+
+# Define the slice_min() verb
+def slice_min(order_by, n=1, with_ties=True):
+    """
+    Select the rows with the smallest values of a column or expression.
+
+    order_by: Column name, symbolic column or symbolic expression to rank by
+    n: Number of rows to keep (per group on grouped input; default: 1)
+    with_ties: If True (default), also keep rows tied with the n-th row, so
+               more than n rows may come back
+
+    Missing values rank last. Rows come back in ascending order of order_by,
+    group by group on grouped input.
+
+    Usage:
+        df >> slice_min(_.price, n=5)
+        df >> group_by(_.region) >> slice_min(_.latency)
+    """
+    return _slice_extreme(order_by, n, with_ties, descending=False)
+
+def _slice_extreme(order_by, n, with_ties, descending):
+    """Build the verb behind slice_max() and slice_min()."""
+    n = max(int(n), 0)
+
+    def _slice(df_or_group):
+        df, codes, n_groups = _ungroup(df_or_group)
+        (values, desc), = _sort_values(df, [order_by], descending)
+        key = _sort_key(values, desc)
+
+        if codes is None:
+            # Only rows at or below the n-th smallest key can make the cut
+            if 0 < n < len(key):
+                candidates = np.flatnonzero(key <= np.partition(key, n - 1)[n - 1])
+            else:
+                candidates = np.arange(len(key) if n else 0)
+            codes = np.zeros(len(candidates), dtype=np.int64)
+            rows = candidates[_top_rows(codes, key[candidates], 1, n, with_ties)]
+        else:
+            rows = _top_rows(codes, key, n_groups, n, with_ties)
+        return df.take(rows)
+
+    return _slice
+
+def _top_rows(codes, key, n_groups, n, with_ties):
+    """
+    Find the n rows with the smallest keys in every group.
+
+    Sorts once on (group, key) packed together, then ranks the rows within
+    their group. Returns row positions, group by group in key order.
+    """
+    order, rank, sizes = _group_positions(codes, n_groups, _sort_order([codes, key], stable=True))
+    if not with_ties or n == 0:
+        return order[rank < n]
+
+    # Keep every row whose key is no larger than its group's n-th key
+    ordered = key[order]
+    last = np.flatnonzero(rank == np.minimum(sizes, n) - 1)
+    threshold = np.empty(n_groups, dtype=ordered.dtype)
+    threshold[codes[order[last]]] = ordered[last]
+    return order[ordered <= threshold[codes[order]]]
@@ -1,4 +1,5 @@
 from gaelach.core.symbolic import SymbolicAttr, ChainedSymbolicAttr
+from gaelach.verbs.bootstrap import Bootstrap
 import pandas as pd
 
 # Define the summarize() verb
@@ -10,8 +11,12 @@ def summarize(**kwargs):
               Use _.column_name with aggregation methods
     
     Returns a function that performs the aggregation on a DataFrame or GroupBy.
+    After bootstrap(), returns one row of statistics per resample instead.
     """
     def _summarize(df_or_group):
+        if isinstance(df_or_group, Bootstrap):
+            return df_or_group.summarize(**kwargs)
+        
         # Check if grouped or ungrouped
         if isinstance(df_or_group, pd.core.groupby.GroupBy):
             # Grouped: build aggregation dict
@@ -1,4 +1,5 @@
 from gaelach.core.symbolic import SymbolicAttr
+from gaelach.utils.groups import _ungroup, _slice_groups
 
 # Define the tail() verb
 def tail(n=5):
@@ -7,9 +8,16 @@ def tail(n=5):
     
     n: Number of rows to return (default: 5)
     
+    On grouped input, returns the last n rows of each group, group by group.
+    
     Returns a function that selects the last n rows.
     """
-    def _tail(df):
+    def _tail(df_or_group):
+        df, codes, n_groups = _ungroup(df_or_group)
+        if codes is not None:
+            # As with DataFrame.tail(), a negative n drops the first -n rows
+            start, stop = (-n, None) if n != 0 else (0, 0)
+            return df.take(_slice_groups(codes, n_groups, start, stop))
         return df.tail(n)
     
     return _tail
\ No newline at end of file
@@ -0,0 +1,53 @@
+from gaelach.utils.sorting import _sort_values, _sort_key
+import numpy as np
+
+# Define the top_k() verb
+def top_k(n, *args, descending=False, na_position="last"):
+    """
+    Return the first n rows in sorted order, without sorting every row.
+
+    n: Number of rows to return
+    *args: Sort keys, as in arrange() (-_.column_name or desc(...) for descending)
+    descending: If True, reverses all sort orders (default: False)
+    na_position: Where missing values sort: "last" (default) or "first"
+
+    The rows that can make the cut are found with a linear-time partition on
+    the first key; only those (plus any rows tied with the n-th) are sorted on
+    all keys. Ties keep their original row order.
+
+    Usage:
+        df >> top_k(10, -_.score)
+        df >> top_k(100, -_.points, _.name)
+        df >> (arrange(-_.score) >> head(10))   # rewritten into top_k(10, -_.score)
+    """
+    def _top_k(df):
+        keys = [_sort_key(values, desc, na_position)
+                for values, desc in _sort_values(df, args, descending)]
+        return df.take(_top_positions(keys, n))
+
+    return _top_k
+
+def _top_positions(keys, n):
+    """
+    Find the positions of the n smallest rows by several sort keys.
+
+    keys: List of key arrays, most significant first (see _sort_key)
+
+    Returns row positions in sorted order; ties keep their original order.
+    """
+    total = len(keys[0]) if keys else 0
+    n = max(min(n, total), 0)
+    if not keys or n == 0:
+        return np.arange(n)
+
+    primary = keys[0]
+    if n < total:
+        # Every row at or below the n-th smallest primary value is a candidate
+        kth = np.partition(primary, n - 1)[n - 1]
+        candidates = np.flatnonzero(primary <= kth)
+    else:
+        candidates = np.arange(total)
+
+    # lexsort is stable and takes the most significant key last
+    order = np.lexsort([key[candidates] for key in reversed(keys)])
+    return candidates[order[:n]]
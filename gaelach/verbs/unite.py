@@ -1,4 +1,5 @@
 from gaelach.core.symbolic import SymbolicAttr
+from gaelach.utils.strings import _join_strings, _from_strings
 import pandas as pd
 import warnings
 
@@ -27,8 +28,9 @@ def unite(new_col, from_cols, sep="_", drop=True):
         # Create a copy to avoid modifying original
         result = df.copy()
         
-        # Convert columns to string and fill NaN with empty string, then concatenate
-        result[new_col] = result[col_names].fillna("").astype(str).agg(sep.join, axis=1)
+        # Concatenate the columns as strings in one pass, with NaN as an empty string
+        joined = _join_strings([result[col] for col in col_names], sep, na_rep="")
+        result[new_col] = _from_strings(joined)
         
         # Drop source columns if requested
         if drop: